@@ -1,4 +1,5 @@
 # Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import copy
 from typing import Any, List, Optional, Tuple, Type, TypeVar, Union, overload
 
 # The node class is the base class for all nodes in the AST. It provides attributes including the line number and fields.
@@ -40,6 +41,27 @@ class FNode(object):
         return False
 
 
+def clone_ast(node: Any) -> Any:
+    """
+    Copies an AST subtree.
+    Children stored in fields are copied recursively, while attributes - including the parent scope -
+    are shared with the original node. This avoids the cost of `copy.deepcopy`, which also copies
+    the entire scope each node refers to.
+    """
+    if isinstance(node, list):
+        return [clone_ast(i) for i in node]
+    if not isinstance(node, FNode):
+        return node
+
+    new_node = copy.copy(node)
+    for name, value in node.__dict__.items():
+        if name in node._fields:
+            setattr(new_node, name, clone_ast(value))
+        elif isinstance(value, list):
+            setattr(new_node, name, list(value))
+    return new_node
+
+
 class Program_Node(FNode):
     _attributes = ()
     _fields = (
@@ -311,6 +333,8 @@ class For_Stmt_Node(FNode):
     )
 
 
+# Loop generated by the frontend whose iterations are meant to be independent, as in Fortran's do concurrent.
+# The SDFG translator currently lowers it like a For_Stmt_Node, i.e., as a sequential loop.
 class Map_Stmt_Node(For_Stmt_Node):
     _attributes = ()
     _fields = (
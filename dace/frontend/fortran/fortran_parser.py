@@ -9,6 +9,7 @@ import dace.frontend.fortran.ast_components as ast_components
 import dace.frontend.fortran.ast_transforms as ast_transforms
 import dace.frontend.fortran.ast_utils as ast_utils
 import dace.frontend.fortran.ast_internal_classes as ast_internal_classes
+import dace.frontend.fortran.intrinsics as intrinsics
 from typing import List, Optional, Tuple, Set
 from dace import dtypes
 from dace import Language as lang
@@ -1062,12 +1063,14 @@ def create_ast_from_string(
     source_string: str,
     sdfg_name: str,
     transform: bool = False,
-    normalize_offsets: bool = False
+    normalize_offsets: bool = False,
+    intrinsic_options: Optional[intrinsics.LoopLoweringOptions] = None
 ):
     """
     Creates an AST from a Fortran file in a string
     :param source_string: The fortran file as a string
     :param sdfg_name: The name to be given to the resulting SDFG
+    :param intrinsic_options: Optional code generation modes of the loop-based intrinsics
     :return: The resulting AST
 
     """
@@ -1089,8 +1092,12 @@ def create_ast_from_string(
         program = ast_transforms.SignToIf().visit(program)
         program = ast_transforms.ArrayToLoop(program).visit(program)
 
+        # The scope analysis is shared by all intrinsic transformations, which keep it up to date
+        ast_transforms.ParentScopeAssigner().visit(program)
+        scope_vars = ast_transforms.ScopeVarsDeclarations()
+        scope_vars.visit(program)
         for transformation in own_ast.fortran_intrinsics().transformations():
-            program = transformation(program).visit(program)
+            program = transformation(program, scope_vars, intrinsic_options).visit(program)
 
         program = ast_transforms.ForDeclarer().visit(program)
         program = ast_transforms.IndexExtractor(program, normalize_offsets).visit(program)
@@ -1101,12 +1108,14 @@ def create_sdfg_from_string(
     source_string: str,
     sdfg_name: str,
     normalize_offsets: bool = False,
-    use_experimental_cfg_blocks: bool = False
+    use_experimental_cfg_blocks: bool = False,
+    intrinsic_options: Optional[intrinsics.LoopLoweringOptions] = None
 ):
     """
     Creates an SDFG from a fortran file in a string
     :param source_string: The fortran file as a string
     :param sdfg_name: The name to be given to the resulting SDFG
+    :param intrinsic_options: Optional code generation modes of the loop-based intrinsics
     :return: The resulting SDFG
     
     """
@@ -1125,8 +1134,12 @@ def create_sdfg_from_string(
     program = ast_transforms.SignToIf().visit(program)
     program = ast_transforms.ArrayToLoop(program).visit(program)
 
+    # The scope analysis is shared by all intrinsic transformations, which keep it up to date
+    ast_transforms.ParentScopeAssigner().visit(program)
+    scope_vars = ast_transforms.ScopeVarsDeclarations()
+    scope_vars.visit(program)
     for transformation in own_ast.fortran_intrinsics().transformations():
-        program = transformation(program).visit(program)
+        program = transformation(program, scope_vars, intrinsic_options).visit(program)
 
     program = ast_transforms.ForDeclarer().visit(program)
     program = ast_transforms.IndexExtractor(program, normalize_offsets).visit(program)
@@ -1149,10 +1162,15 @@ def create_sdfg_from_string(
     return sdfg
 
 
-def create_sdfg_from_fortran_file(source_string: str, use_experimental_cfg_blocks: bool = False):
+def create_sdfg_from_fortran_file(
+    source_string: str,
+    use_experimental_cfg_blocks: bool = False,
+    intrinsic_options: Optional[intrinsics.LoopLoweringOptions] = None
+):
     """
     Creates an SDFG from a fortran file
     :param source_string: The fortran file name
+    :param intrinsic_options: Optional code generation modes of the loop-based intrinsics
     :return: The resulting SDFG
 
     """
@@ -1171,8 +1189,12 @@ def create_sdfg_from_fortran_file(source_string: str, use_experimental_cfg_block
     program = ast_transforms.SignToIf().visit(program)
     program = ast_transforms.ArrayToLoop(program).visit(program)
 
-    for transformation in own_ast.fortran_intrinsics():
-        program = transformation(program).visit(program)
+    # The scope analysis is shared by all intrinsic transformations, which keep it up to date
+    ast_transforms.ParentScopeAssigner().visit(program)
+    scope_vars = ast_transforms.ScopeVarsDeclarations()
+    scope_vars.visit(program)
+    for transformation in own_ast.fortran_intrinsics().transformations():
+        program = transformation(program, scope_vars, intrinsic_options).visit(program)
 
     program = ast_transforms.ForDeclarer().visit(program)
     program = ast_transforms.IndexExtractor(program).visit(program)
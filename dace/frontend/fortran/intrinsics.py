@@ -1,12 +1,11 @@
 
 from abc import abstractmethod
-import copy
 import math
 from typing import Any, List, Optional, Set, Tuple, Type
 
 from dace.frontend.fortran import ast_internal_classes
-from dace.frontend.fortran.ast_utils import fortrantypes2dacetypes
-from dace.frontend.fortran.ast_transforms import NodeVisitor, NodeTransformer, ParentScopeAssigner, ScopeVarsDeclarations, par_Decl_Range_Finder, mywalk
+from dace.frontend.fortran.ast_utils import fortrantypes2dacetypes, get_name
+from dace.frontend.fortran.ast_transforms import NodeVisitor, NodeTransformer, ParentScopeAssigner, ScopeVarsDeclarations, par_Decl_Range_Finder, mywalk, RenameVar, RenameArguments
 
 FASTNode = Any
 
@@ -26,6 +25,10 @@ class IntrinsicTransformation:
     def has_transformation() -> bool:
         return False
 
+def _selected_int_kind(digits: int) -> int:
+    # Number of bytes required to store integers with the given number of decimal digits
+    return math.ceil((math.log2(math.pow(10, digits)) + 1) / 8)
+
 class SelectedKind(IntrinsicTransformation):
 
     FUNCTIONS = {
@@ -33,6 +36,9 @@ class SelectedKind(IntrinsicTransformation):
         "SELECTED_REAL_KIND": "__dace_selected_real_kind",
     }
 
+    # Precomputed for the range of decimal digits supported by Fortran compilers
+    INT_KINDS = tuple(_selected_int_kind(digits) for digits in range(40))
+
     @staticmethod
     def replaced_name(func_name: str) -> str:
         return SelectedKind.FUNCTIONS[func_name]
@@ -41,14 +47,19 @@ class SelectedKind(IntrinsicTransformation):
     def replace(func_name: ast_internal_classes.Name_Node, args: ast_internal_classes.Arg_List_Node, line) -> ast_internal_classes.FNode:
 
         if func_name.name == "__dace_selected_int_kind":
-            return ast_internal_classes.Int_Literal_Node(value=str(
-                math.ceil((math.log2(math.pow(10, int(args.args[0].value))) + 1) / 8)),
-                                                         line_number=line)
+            digits = int(args.args[0].value)
+            if 0 <= digits < len(SelectedKind.INT_KINDS):
+                kind = SelectedKind.INT_KINDS[digits]
+            else:
+                kind = _selected_int_kind(digits)
+            return ast_internal_classes.Int_Literal_Node(value=str(kind), line_number=line)
         # This selects the smallest kind that can hold the given number of digits (fp64,fp32 or fp16)
         elif func_name.name == "__dace_selected_real_kind":
-            if int(args.args[0].value) >= 9 or int(args.args[1].value) > 126:
+            precision = int(args.args[0].value)
+            exponent_range = int(args.args[1].value)
+            if precision >= 9 or exponent_range > 126:
                 return ast_internal_classes.Int_Literal_Node(value="8", line_number=line)
-            elif int(args.args[0].value) >= 3 or int(args.args[1].value) > 14:
+            elif precision >= 3 or exponent_range > 14:
                 return ast_internal_classes.Int_Literal_Node(value="4", line_number=line)
             else:
                 return ast_internal_classes.Int_Literal_Node(value="2", line_number=line)
@@ -76,37 +87,82 @@ class LoopBasedReplacement:
     def has_transformation() -> bool:
         return True
 
+class LoopLoweringOptions:
+
+    """
+        Optional code generation modes of the loop-based intrinsics, all disabled by default.
+
+        :param chunk_size: Number of independent partial results used by SUM and PRODUCT when strip-mining
+                           the innermost dimension; see SumProduct. Changes the order of floating-point operations.
+        :param unroll_threshold: Largest static extent of the innermost dimension that is fully unrolled
+                                 instead of generating a loop; see LoopBasedReplacementTransformation.
+    """
+    def __init__(self, chunk_size: Optional[int] = None, unroll_threshold: Optional[int] = None):
+        self.chunk_size = chunk_size
+        self.unroll_threshold = unroll_threshold
+
 class LoopBasedReplacementVisitor(NodeVisitor):
 
     """
-    Finds all intrinsic operations that have to be transformed to loops in the AST
+    Finds all intrinsic operations that have to be transformed to loops in the AST.
+    We record the calls to the intrinsic that are assigned to a variable.
     """
     def __init__(self, func_name: str):
         self._func_name = func_name
-        self.nodes: List[ast_internal_classes.FNode] = []
+        self.nodes: List[ast_internal_classes.Call_Expr_Node] = []
 
     def visit_BinOp_Node(self, node: ast_internal_classes.BinOp_Node):
 
         if isinstance(node.rval, ast_internal_classes.Call_Expr_Node):
             if node.rval.name.name == self._func_name:
-                self.nodes.append(node)
+                self.nodes.append(node.rval)
 
     def visit_Execution_Part_Node(self, node: ast_internal_classes.Execution_Part_Node):
         return
 
+def _make_map(index: int, start: ast_internal_classes.FNode, end: ast_internal_classes.FNode,
+              body: ast_internal_classes.FNode, line_number, step: int = 1) -> ast_internal_classes.Map_Stmt_Node:
+
+    """
+        Creates a map over the iterator tmp_parfor_{index}, from start to end (inclusive).
+        The header expressions share a single node of the iterator.
+        A nested map is used as the body directly, while statements are wrapped in an execution part.
+    """
+    iterator = ast_internal_classes.Name_Node(name=f"tmp_parfor_{index}")
+    init = ast_internal_classes.BinOp_Node(lval=iterator, op="=", rval=start, line_number=line_number)
+    cond = ast_internal_classes.BinOp_Node(lval=iterator, op="<=", rval=end, line_number=line_number)
+    iter = ast_internal_classes.BinOp_Node(
+        lval=iterator,
+        op="=",
+        rval=ast_internal_classes.BinOp_Node(
+            lval=iterator,
+            op="+",
+            rval=ast_internal_classes.Int_Literal_Node(value=str(step))),
+        line_number=line_number)
+
+    if not isinstance(body, (ast_internal_classes.Execution_Part_Node, ast_internal_classes.Map_Stmt_Node)):
+        body = ast_internal_classes.Execution_Part_Node(execution=[body])
+
+    return ast_internal_classes.Map_Stmt_Node(init=init, cond=cond, iter=iter, body=body, line_number=line_number)
+
 class LoopBasedReplacementTransformation(NodeTransformer):
 
     """
     Transforms the AST by removing intrinsic call and replacing it with loops
     """
-    def __init__(self, ast):
+
+    _SIMPLE_STATEMENTS = (
+        ast_internal_classes.BinOp_Node,
+        ast_internal_classes.Call_Expr_Node,
+        ast_internal_classes.Decl_Stmt_Node
+    )
+
+    def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
         self.count = 0
 
-        # We need to rerun the assignment because transformations could have created
-        # new AST nodes
-        ParentScopeAssigner().visit(ast)
-        self.scope_vars = ScopeVarsDeclarations()
-        self.scope_vars.visit(ast)
+        # Shared by all transformations applied to the program, see ``_assign_scope``
+        self.scope_vars = scope_vars
+        self.options = options if options is not None else LoopLoweringOptions()
         self.rvals = []
 
     @staticmethod
@@ -210,7 +266,7 @@ class LoopBasedReplacementTransformation(NodeTransformer):
 
             # replace the array subscript node in the binary operation
             # ignore this when the operand is a scalar
-            cond = copy.deepcopy(arg)
+            cond = ast_internal_classes.clone_ast(arg)
             if first_array is not None:
                 cond.lval = dominant_array
             if second_array is not None:
@@ -226,7 +282,7 @@ class LoopBasedReplacementTransformation(NodeTransformer):
                 raise TypeError("Can't parse Fortran binary op with different array ranks!")
 
         # Now, we need to convert the array to a proper subscript node
-        cond = copy.deepcopy(arg)
+        cond = ast_internal_classes.clone_ast(arg)
         cond.lval = first_array
         cond.rval = second_array
 
@@ -262,17 +318,157 @@ class LoopBasedReplacementTransformation(NodeTransformer):
                 )
                 array.indices[i] = new_index
 
+    def _same_bound(self, scope: ast_internal_classes.FNode, first: ast_internal_classes.FNode, second: ast_internal_classes.FNode) -> bool:
+
+        """
+            Conservatively checks if two loop boundaries are guaranteed to be equal.
+            For full-range accesses (ParDecl ALL), we compare the declared sizes of both arrays.
+        """
+        if isinstance(first, ast_internal_classes.Name_Range_Node) and isinstance(second, ast_internal_classes.Name_Range_Node):
+            if first.name != "f2dace_MAX" or second.name != "f2dace_MAX":
+                return first.name == second.name
+            first_decl = self.scope_vars.get_var(scope, first.arrname.name)
+            second_decl = self.scope_vars.get_var(scope, second.arrname.name)
+            return self._same_bound(scope, first_decl.sizes[first.pos], second_decl.sizes[second.pos])
+
+        if type(first) is not type(second):
+            return False
+
+        if isinstance(first, ast_internal_classes.Int_Literal_Node):
+            return int(first.value) == int(second.value)
+        if isinstance(first, ast_internal_classes.Name_Node):
+            return first.name == second.name
+        if isinstance(first, ast_internal_classes.BinOp_Node):
+            return first.op == second.op and self._same_bound(scope, first.lval, second.lval) and \
+                self._same_bound(scope, first.rval, second.rval)
+
+        return False
+
+    def _static_bound(self, scope: ast_internal_classes.FNode, bound: ast_internal_classes.FNode) -> Optional[int]:
+
+        """
+            Evaluates a loop boundary known at compile time, e.g., a literal or the declared size of an array.
+            Returns None if the boundary depends on runtime values.
+        """
+        if isinstance(bound, ast_internal_classes.Int_Literal_Node):
+            return int(bound.value)
+
+        if isinstance(bound, ast_internal_classes.Name_Range_Node) and bound.name == "f2dace_MAX":
+            var_decl = self.scope_vars.get_var(scope, bound.arrname.name)
+            return self._static_bound(scope, var_decl.sizes[bound.pos])
+
+        if isinstance(bound, ast_internal_classes.BinOp_Node) and bound.op in ["+", "-"]:
+            left = self._static_bound(scope, bound.lval)
+            right = self._static_bound(scope, bound.rval)
+            if left is None or right is None:
+                return None
+            return left + right if bound.op == "+" else left - right
+
+        return None
+
+    def _can_fuse(self, loop_nest: dict, node: ast_internal_classes.FNode, read_vars: Set[str], written_var: str) -> bool:
+
+        """
+            Two consecutive intrinsic calls can share a single loop nest when they iterate
+            over the same space, and neither of them reads the result of the other.
+        """
+        if len(loop_nest["ranges"]) != len(self.loop_ranges):
+            return False
+
+        for (first_start, first_end), (second_start, second_end) in zip(loop_nest["ranges"], self.loop_ranges):
+            if not self._same_bound(node.parent, first_start, second_start) or \
+                not self._same_bound(node.parent, first_end, second_end):
+                return False
+
+        if written_var in loop_nest["read_vars"] or written_var in loop_nest["written_vars"]:
+            return False
+
+        return len(read_vars & loop_nest["written_vars"]) == 0
+
+    def _generate_loop_nest(self, node: ast_internal_classes.FNode, body: ast_internal_classes.FNode) -> Tuple[
+            List[ast_internal_classes.FNode],
+            Optional[ast_internal_classes.Map_Stmt_Node]
+        ]:
+
+        """
+            Wraps the loop body in one map per dimension of the iteration space.
+            Returns the generated statements and the innermost map, or None when the nest must not be fused.
+
+            Loop ranges follow the order of array dimensions and each map wraps the previous one.
+            Thus, the first dimension becomes the innermost loop - the contiguous one in column-major layout.
+
+            When the unroll_threshold option is set, an innermost dimension with a static extent up to the threshold
+            is replaced by copies of the loop body, one for each value of the iterator.
+        """
+        range_index = 0
+        innermost = None
+
+        # Fully unroll the innermost dimension when its extent is small and known at compile time
+        unroll_threshold = self.options.unroll_threshold
+        if unroll_threshold is not None and len(self.loop_ranges) > 0:
+            start = self._static_bound(node.parent, self.loop_ranges[0][0])
+            end = self._static_bound(node.parent, self.loop_ranges[0][1])
+            if start is not None and end is not None and end - start + 1 <= unroll_threshold:
+                iterator = ast_internal_classes.Name_Node(name=f"tmp_parfor_{self.count}")
+                body = ast_internal_classes.Execution_Part_Node(execution=[
+                    RenameArguments([ast_internal_classes.Int_Literal_Node(value=str(value))],
+                                    [iterator]).visit(ast_internal_classes.clone_ast(body))
+                    for value in range(start, end + 1)
+                ])
+                range_index = 1
+
+        for initrange, finalrange in self.loop_ranges[range_index:]:
+            current_for = _make_map(self.count + range_index, initrange, finalrange, body, node.line_number)
+            # Unrolled bodies are not extended with other intrinsics
+            if range_index == 0:
+                innermost = current_for
+            body = current_for
+            range_index += 1
+
+        if isinstance(body, ast_internal_classes.Execution_Part_Node):
+            return body.execution, innermost
+        return [body], innermost
+
+    def _assign_scope(self, node: ast_internal_classes.Execution_Part_Node, statements: List[ast_internal_classes.FNode]):
+
+        """
+            Assigns the parent scope of the execution part to the generated statements and records
+            the temporaries they declare, such that following transformations can look them up.
+        """
+        assigner = ParentScopeAssigner()
+        for stmt in statements:
+            assigner.visit(stmt, node)
+            self.scope_vars.visit(stmt)
+
     def visit_Execution_Part_Node(self, node: ast_internal_classes.Execution_Part_Node):
 
         newbody = []
 
+        # The last generated loop nest, used to fuse consecutive calls over the same iteration space.
+        loop_nest = None
+
         for child in node.execution:
             lister = LoopBasedReplacementVisitor(self.func_name())
             lister.visit(child)
             res = lister.nodes
 
             if res is None or len(res) == 0:
-                newbody.append(self.visit(child))
+
+                # Simple statements cannot contain nested execution parts with intrinsic calls,
+                # and the lister already verified it, so they do not have to be visited.
+                if not isinstance(child, self._SIMPLE_STATEMENTS):
+                    child = self.visit(child)
+
+                # Declarations of temporaries, e.g., created by the call extraction,
+                # can be safely moved before the loop nest to keep it fusable.
+                if loop_nest is not None and isinstance(child, ast_internal_classes.Decl_Stmt_Node) and \
+                    all(getattr(var, "init", None) is None for var in child.vardecl):
+                    newbody.insert(loop_nest["position"], child)
+                    loop_nest["position"] += 1
+                    continue
+
+                newbody.append(child)
+                loop_nest = None
                 continue
 
             self.loop_ranges = []
@@ -281,12 +477,17 @@ class LoopBasedReplacementTransformation(NodeTransformer):
             self._initialize()
 
             # Visit all intrinsic arguments and extract arrays
-            for i in mywalk(child.rval):
-                if isinstance(i, ast_internal_classes.Call_Expr_Node) and i.name.name == self.func_name():
-                    self._parse_call_expr_node(i)
+            for call in res:
+                self._parse_call_expr_node(call)
+
+            read_vars = set(i.name for i in mywalk(child.rval) if isinstance(i, ast_internal_classes.Name_Node))
+            written_var = None
+            if isinstance(child.lval, (ast_internal_classes.Name_Node, ast_internal_classes.Array_Subscript_Node)):
+                written_var = get_name(child.lval)
 
             # Verify that all of intrinsic args are correct and prepare them for loop generation
-            self._summarize_args(node, child, newbody)
+            prologue = []
+            self._summarize_args(node, child, prologue)
 
             # Change the type of result variable
             self._update_result_type(child.lval)
@@ -294,52 +495,62 @@ class LoopBasedReplacementTransformation(NodeTransformer):
             # Initialize the result variable
             init_stm = self._initialize_result(child)
             if init_stm is not None:
-                newbody.append(init_stm)
+                prologue.append(init_stm)
 
             # Generate the intrinsic-specific logic inside loop body
             body = self._generate_loop_body(child)
 
-            # Now generate the multi-dimensiona loop header and updates
-            range_index = 0
-            for i in self.loop_ranges:
-                initrange = i[0]
-                finalrange = i[1]
-                init = ast_internal_classes.BinOp_Node(
-                    lval=ast_internal_classes.Name_Node(name="tmp_parfor_" + str(self.count + range_index)),
-                    op="=",
-                    rval=initrange,
-                    line_number=child.line_number)
-                cond = ast_internal_classes.BinOp_Node(
-                    lval=ast_internal_classes.Name_Node(name="tmp_parfor_" + str(self.count + range_index)),
-                    op="<=",
-                    rval=finalrange,
-                    line_number=child.line_number)
-                iter = ast_internal_classes.BinOp_Node(
-                    lval=ast_internal_classes.Name_Node(name="tmp_parfor_" + str(self.count + range_index)),
-                    op="=",
-                    rval=ast_internal_classes.BinOp_Node(
-                        lval=ast_internal_classes.Name_Node(name="tmp_parfor_" + str(self.count + range_index)),
-                        op="+",
-                        rval=ast_internal_classes.Int_Literal_Node(value="1")),
-                    line_number=child.line_number)
-                current_for = ast_internal_classes.Map_Stmt_Node(
-                    init=init,
-                    cond=cond,
-                    iter=iter,
-                    body=ast_internal_classes.Execution_Part_Node(execution=[body]),
-                    line_number=child.line_number)
-                body = current_for
-                range_index += 1
-
-            newbody.append(body)
-
-            self.count = self.count + range_index
-        return ast_internal_classes.Execution_Part_Node(execution=newbody)
-
-class SumProduct(LoopBasedReplacementTransformation):
-
-    def __init__(self, ast):
-        super().__init__(ast)
+            if loop_nest is not None and written_var is not None and self._can_fuse(loop_nest, child, read_vars, written_var):
+
+                # Reuse the iterators of the existing loop nest
+                for range_index in range(len(self.loop_ranges)):
+                    body = RenameVar(
+                        "tmp_parfor_" + str(self.count + range_index),
+                        "tmp_parfor_" + str(loop_nest["count"] + range_index)
+                    ).visit(body)
+
+                innermost = loop_nest["innermost"]
+                innermost.body.execution.append(body)
+                self._assign_scope(node, prologue + [body])
+
+                newbody[loop_nest["position"]:loop_nest["position"]] = prologue
+                loop_nest["position"] += len(prologue)
+                loop_nest["read_vars"] |= read_vars
+                loop_nest["written_vars"].add(written_var)
+
+                self.count = self.count + len(self.loop_ranges)
+                continue
+
+            statements, innermost = self._generate_loop_nest(child, body)
+            self._assign_scope(node, prologue + statements)
+            newbody.extend(prologue)
+
+            if innermost is not None and written_var is not None:
+                loop_nest = {
+                    "position": len(newbody),
+                    "ranges": self.loop_ranges,
+                    "count": self.count,
+                    "innermost": innermost,
+                    "read_vars": read_vars,
+                    "written_vars": {written_var}
+                }
+            else:
+                loop_nest = None
+
+            newbody.extend(statements)
+
+            self.count = self.count + len(self.loop_ranges)
+        return ast_internal_classes.Execution_Part_Node(execution=newbody, parent=node.parent)
+
+class SingleArrayReductionTransformation(LoopBasedReplacementTransformation):
+
+    """
+        Common implementation of SUM, PRODUCT, MINVAL and MAXVAL: the intrinsic reduces a single array
+        into a result that has the type of array elements.
+    """
+
+    def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+        super().__init__(ast, scope_vars, options)
 
     def _initialize(self):
         self.rvals = []
@@ -348,7 +559,7 @@ class SumProduct(LoopBasedReplacementTransformation):
     def _update_result_type(self, var: ast_internal_classes.Name_Node):
 
         """
-            For both SUM and PRODUCT, the result type depends on the input variable.
+            The result type depends on the input variable.
         """
         input_type = self.scope_vars.get_var(var.parent, self.argument_variable.name.name)
 
@@ -365,8 +576,7 @@ class SumProduct(LoopBasedReplacementTransformation):
             if array_node is not None:
                 self.rvals.append(array_node)
             else:
-                raise NotImplementedError("We do not support non-array arguments for SUM/PRODUCT")
-
+                raise NotImplementedError(f"We do not support non-array arguments for {self.func_name()}")
 
     def _summarize_args(self, exec_node: ast_internal_classes.Execution_Part_Node, node: ast_internal_classes.FNode, new_func_body: List[ast_internal_classes.FNode]):
 
@@ -377,6 +587,18 @@ class SumProduct(LoopBasedReplacementTransformation):
 
         par_Decl_Range_Finder(self.argument_variable, self.loop_ranges, [], [], self.count, new_func_body, self.scope_vars, True)
 
+class SumProduct(SingleArrayReductionTransformation):
+
+    """
+        When the chunk_size option is set, the innermost dimension with a statically known extent of at least
+        two chunks is strip-mined: each chunk updates chunk_size independent partial results,
+        which are combined after the loop nest. This breaks the dependency chain on the result variable
+        at the cost of changing the order of floating-point operations; thus, it is disabled by default.
+    """
+
+    def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+        super().__init__(ast, scope_vars, options)
+
     def _initialize_result(self, node: ast_internal_classes.FNode) -> ast_internal_classes.BinOp_Node:
 
         return ast_internal_classes.BinOp_Node(
@@ -386,6 +608,102 @@ class SumProduct(LoopBasedReplacementTransformation):
             line_number=node.line_number
         )
 
+    def _generate_loop_nest(self, node: ast_internal_classes.FNode, body: ast_internal_classes.FNode) -> Tuple[
+            List[ast_internal_classes.FNode],
+            Optional[ast_internal_classes.Map_Stmt_Node]
+        ]:
+
+        chunk = self.options.chunk_size
+        if chunk is None or len(self.loop_ranges) == 0:
+            return super()._generate_loop_nest(node, body)
+
+        start = self._static_bound(node.parent, self.loop_ranges[0][0])
+        end = self._static_bound(node.parent, self.loop_ranges[0][1])
+        if start is None or end is None or end - start + 1 < 2 * chunk:
+            return super()._generate_loop_nest(node, body)
+
+        chunks = (end - start + 1) // chunk
+        iterator = "tmp_parfor_" + str(self.count)
+        op = self._result_update_op()
+        result_type = self.scope_vars.get_var(node.parent, self.argument_variable.name.name).type
+
+        statements = []
+        chunk_body = []
+        partial_results = []
+        for k in range(chunk):
+
+            partial = ast_internal_classes.Name_Node(name=f"tmp_chunk_{self.count}_{k}", type=result_type)
+            partial_results.append(partial)
+            statements.append(
+                ast_internal_classes.Decl_Stmt_Node(vardecl=[
+                    ast_internal_classes.Var_Decl_Node(name=partial.name, type=result_type, sizes=None)
+                ]))
+            statements.append(
+                ast_internal_classes.BinOp_Node(
+                    lval=partial,
+                    op="=",
+                    rval=ast_internal_classes.Int_Literal_Node(value=self._result_init_value()),
+                    line_number=node.line_number
+                ))
+
+            # Each partial result accumulates one element of the chunk
+            array = ast_internal_classes.clone_ast(self.argument_variable)
+            if k > 0:
+                array.indices = [
+                    ast_internal_classes.BinOp_Node(
+                        lval=idx, op="+", rval=ast_internal_classes.Int_Literal_Node(value=str(k)))
+                    if isinstance(idx, ast_internal_classes.Name_Node) and idx.name == iterator else idx
+                    for idx in array.indices
+                ]
+            chunk_body.append(
+                ast_internal_classes.BinOp_Node(
+                    lval=partial,
+                    op="=",
+                    rval=ast_internal_classes.BinOp_Node(lval=partial, op=op, rval=array, line_number=node.line_number),
+                    line_number=node.line_number
+                ))
+
+        chunk_loop = _make_map(
+            self.count,
+            ast_internal_classes.Int_Literal_Node(value=str(start)),
+            ast_internal_classes.Int_Literal_Node(value=str(start + (chunks - 1) * chunk)),
+            ast_internal_classes.Execution_Part_Node(execution=chunk_body),
+            node.line_number,
+            step=chunk
+        )
+        loops = [chunk_loop]
+
+        loop_ranges = self.loop_ranges
+
+        # Remaining elements are accumulated directly into the result
+        if start + chunks * chunk <= end:
+            self.loop_ranges = [[
+                ast_internal_classes.Int_Literal_Node(value=str(start + chunks * chunk)),
+                ast_internal_classes.Int_Literal_Node(value=str(end))
+            ]]
+            loops.extend(super()._generate_loop_nest(node, body)[0])
+
+        # Outer maps wrap both the chunked loop and the remainder
+        self.loop_ranges = loop_ranges[1:]
+        self.count += 1
+        nest, _ = super()._generate_loop_nest(node, ast_internal_classes.Execution_Part_Node(execution=loops))
+        self.loop_ranges = loop_ranges
+        self.count -= 1
+        statements.extend(nest)
+
+        combined = partial_results[0]
+        for partial in partial_results[1:]:
+            combined = ast_internal_classes.BinOp_Node(lval=combined, op=op, rval=partial, line_number=node.line_number)
+        statements.append(
+            ast_internal_classes.BinOp_Node(
+                lval=node.lval,
+                op="=",
+                rval=ast_internal_classes.BinOp_Node(lval=node.lval, op=op, rval=combined, line_number=node.line_number),
+                line_number=node.line_number
+            ))
+
+        return statements, None
+
     def _generate_loop_body(self, node: ast_internal_classes.FNode) -> ast_internal_classes.BinOp_Node:
 
         return ast_internal_classes.BinOp_Node(
@@ -414,8 +732,8 @@ class Sum(LoopBasedReplacement):
 
     class Transformation(SumProduct):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         @staticmethod
         def func_name() -> str:
@@ -440,8 +758,8 @@ class Product(LoopBasedReplacement):
 
     class Transformation(SumProduct):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         @staticmethod
         def func_name() -> str:
@@ -455,8 +773,8 @@ class Product(LoopBasedReplacement):
 
 class AnyAllCountTransformation(LoopBasedReplacementTransformation):
 
-    def __init__(self, ast):
-        super().__init__(ast)
+    def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+        super().__init__(ast, scope_vars, options)
 
     def _initialize(self):
         self.rvals = []
@@ -533,14 +851,9 @@ class AnyAllCountTransformation(LoopBasedReplacementTransformation):
         For all, we check if the condition is NOT true and then set the value to false
         """
 
+        # No early exit, since the loop is generated as a map
         body_if = ast_internal_classes.Execution_Part_Node(execution=[
-            self._result_loop_update(node),
-            # TODO: we should make the `break` generation conditional based on the architecture
-            # For parallel maps, we should have no breaks
-            # For sequential loop, we want a break to be faster
-            #ast_internal_classes.Break_Node(
-            #    line_number=node.line_number
-            #)
+            self._result_loop_update(node)
         ])
 
         return ast_internal_classes.If_Stmt_Node(
@@ -575,8 +888,8 @@ class Any(LoopBasedReplacement):
     """
     class Transformation(AnyAllCountTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _result_init_value(self):
             return "0"
@@ -584,7 +897,7 @@ class Any(LoopBasedReplacement):
         def _result_loop_update(self, node: ast_internal_classes.FNode):
 
             return ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(node.lval),
+                lval=ast_internal_classes.clone_ast(node.lval),
                 op="=",
                 rval=ast_internal_classes.Int_Literal_Node(value="1"),
                 line_number=node.line_number
@@ -607,8 +920,8 @@ class All(LoopBasedReplacement):
     """
     class Transformation(AnyAllCountTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _result_init_value(self):
             return "1"
@@ -616,7 +929,7 @@ class All(LoopBasedReplacement):
         def _result_loop_update(self, node: ast_internal_classes.FNode):
 
             return ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(node.lval),
+                lval=ast_internal_classes.clone_ast(node.lval),
                 op="=",
                 rval=ast_internal_classes.Int_Literal_Node(value="0"),
                 line_number=node.line_number
@@ -644,8 +957,8 @@ class Count(LoopBasedReplacement):
     """
     class Transformation(AnyAllCountTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _result_init_value(self):
             return "0"
@@ -653,13 +966,13 @@ class Count(LoopBasedReplacement):
         def _result_loop_update(self, node: ast_internal_classes.FNode):
 
             update = ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(node.lval),
+                lval=ast_internal_classes.clone_ast(node.lval),
                 op="+",
                 rval=ast_internal_classes.Int_Literal_Node(value="1"),
                 line_number=node.line_number
             )
             return ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(node.lval),
+                lval=ast_internal_classes.clone_ast(node.lval),
                 op="=",
                 rval=update,
                 line_number=node.line_number
@@ -673,46 +986,10 @@ class Count(LoopBasedReplacement):
             return "__dace_count"
 
 
-class MinMaxValTransformation(LoopBasedReplacementTransformation):
-
-    def __init__(self, ast):
-        super().__init__(ast)
-
-    def _initialize(self):
-        self.rvals = []
-        self.argument_variable = None
-
-    def _update_result_type(self, var: ast_internal_classes.Name_Node):
-
-        """
-            For both MINVAL and MAXVAL, the result type depends on the input variable.
-        """
-
-        input_type = self.scope_vars.get_var(var.parent, self.argument_variable.name.name)
-
-        var_decl = self.scope_vars.get_var(var.parent, var.name)
-        var.type = input_type.type
-        var_decl.type = input_type.type
-
-    def _parse_call_expr_node(self, node: ast_internal_classes.Call_Expr_Node):
-
-        for arg in node.args:
+class MinMaxValTransformation(SingleArrayReductionTransformation):
 
-            array_node = self._parse_array(node, arg)
-
-            if array_node is not None:
-                self.rvals.append(array_node)
-            else:
-                raise NotImplementedError("We do not support non-array arguments for MINVAL/MAXVAL")
-
-    def _summarize_args(self, exec_node: ast_internal_classes.Execution_Part_Node, node: ast_internal_classes.FNode, new_func_body: List[ast_internal_classes.FNode]):
-
-        if len(self.rvals) != 1:
-            raise NotImplementedError("Only one array can be summed")
-
-        self.argument_variable = self.rvals[0]
-
-        par_Decl_Range_Finder(self.argument_variable, self.loop_ranges, [], [], self.count, new_func_body, self.scope_vars, True)
+    def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+        super().__init__(ast, scope_vars, options)
 
     def _initialize_result(self, node: ast_internal_classes.FNode) -> ast_internal_classes.BinOp_Node:
 
@@ -753,8 +1030,8 @@ class MinVal(LoopBasedReplacement):
     """
     class Transformation(MinMaxValTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _result_init_value(self, array: ast_internal_classes.Array_Subscript_Node):
 
@@ -788,8 +1065,8 @@ class MaxVal(LoopBasedReplacement):
     """
     class Transformation(MinMaxValTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _result_init_value(self, array: ast_internal_classes.Array_Subscript_Node):
 
@@ -817,8 +1094,8 @@ class Merge(LoopBasedReplacement):
 
     class Transformation(LoopBasedReplacementTransformation):
 
-        def __init__(self, ast):
-            super().__init__(ast)
+        def __init__(self, ast, scope_vars: ScopeVarsDeclarations, options: Optional[LoopLoweringOptions] = None):
+            super().__init__(ast, scope_vars, options)
 
         def _initialize(self):
             self.rvals = []
@@ -911,14 +1188,14 @@ class Merge(LoopBasedReplacement):
             """
 
             copy_first = ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(self.destination_array),
+                lval=ast_internal_classes.clone_ast(self.destination_array),
                 op="=",
                 rval=self.first_array,
                 line_number=node.line_number
             )
 
             copy_second = ast_internal_classes.BinOp_Node(
-                lval=copy.deepcopy(self.destination_array),
+                lval=ast_internal_classes.clone_ast(self.destination_array),
                 op="=",
                 rval=self.second_array,
                 line_number=node.line_number
@@ -963,6 +1240,36 @@ class FortranIntrinsics:
         Merge
     ]
 
+    # Intrinsics directly mapped to functions supported in tasklets
+    FUNCTION_NAME_REPLACEMENTS = {
+        "INT": "__dace_int",
+        "DBLE": "__dace_dble",
+        "SQRT": "sqrt",
+        "COSH": "cosh",
+        "ABS": "abs",
+        "MIN": "min",
+        "MAX": "max",
+        "EXP": "exp",
+        "EPSILON": "__dace_epsilon",
+        "TANH": "tanh",
+        "SIGN": "__dace_sign"
+    }
+
+    # Result types of the directly mapped functions
+    FUNCTION_TYPES = {
+        "__dace_int": "INT",
+        "__dace_dble": "DOUBLE",
+        "sqrt": "DOUBLE",
+        "cosh": "DOUBLE",
+        "abs": "DOUBLE",
+        "min": "DOUBLE",
+        "max": "DOUBLE",
+        "exp": "DOUBLE",
+        "__dace_epsilon": "DOUBLE",
+        "tanh": "DOUBLE",
+        "__dace_sign": "DOUBLE",
+    }
+
     def __init__(self):
         self._transformations_to_run = set()
 
@@ -980,47 +1287,21 @@ class FortranIntrinsics:
     def replace_function_name(self, node: FASTNode) -> ast_internal_classes.Name_Node:
 
         func_name = node.string
-        replacements = {
-            "INT": "__dace_int",
-            "DBLE": "__dace_dble",
-            "SQRT": "sqrt",
-            "COSH": "cosh",
-            "ABS": "abs",
-            "MIN": "min",
-            "MAX": "max",
-            "EXP": "exp",
-            "EPSILON": "__dace_epsilon",
-            "TANH": "tanh",
-            "SIGN": "__dace_sign",
-            "EXP": "exp"
-        }
-        if func_name in replacements:
-            return ast_internal_classes.Name_Node(name=replacements[func_name])
-        else:
+        replacement = self.FUNCTION_NAME_REPLACEMENTS.get(func_name)
+        if replacement is not None:
+            return ast_internal_classes.Name_Node(name=replacement)
 
-            if self.IMPLEMENTATIONS_AST[func_name].has_transformation():
-                self._transformations_to_run.add(self.IMPLEMENTATIONS_AST[func_name].Transformation)
+        implementation = self.IMPLEMENTATIONS_AST[func_name]
+        if implementation.has_transformation():
+            self._transformations_to_run.add(implementation.Transformation)
 
-            return ast_internal_classes.Name_Node(name=self.IMPLEMENTATIONS_AST[func_name].replaced_name(func_name))
+        return ast_internal_classes.Name_Node(name=implementation.replaced_name(func_name))
 
     def replace_function_reference(self, name: ast_internal_classes.Name_Node, args: ast_internal_classes.Arg_List_Node, line):
 
-        func_types = {
-            "__dace_int": "INT",
-            "__dace_dble": "DOUBLE",
-            "sqrt": "DOUBLE",
-            "cosh": "DOUBLE",
-            "abs": "DOUBLE",
-            "min": "DOUBLE",
-            "max": "DOUBLE",
-            "exp": "DOUBLE",
-            "__dace_epsilon": "DOUBLE",
-            "tanh": "DOUBLE",
-            "__dace_sign": "DOUBLE",
-        }
-        if name.name in func_types:
+        call_type = self.FUNCTION_TYPES.get(name.name)
+        if call_type is not None:
             # FIXME: this will be progressively removed
-            call_type = func_types[name.name]
             return ast_internal_classes.Call_Expr_Node(name=name, type=call_type, args=args.args, line_number=line)
         elif name.name in self.DIRECT_REPLACEMENTS:
             return self.DIRECT_REPLACEMENTS[name.name].replace(name, args, line)
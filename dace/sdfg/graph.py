@@ -437,25 +437,30 @@ class SubgraphView(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
     def __init__(self, graph: Graph[NodeT, EdgeT], subgraph_nodes: Sequence[NodeT]):
         super().__init__()
         self._graph = graph
-        self._subgraph_nodes = list(sorted(subgraph_nodes, key=lambda n: graph.node_id(n)))
+        # Keep the nodes in graph order; a set is kept alongside for constant-time membership checks
+        self._subgraph_node_set = set(subgraph_nodes)
+        self._subgraph_nodes = [n for n in graph.nodes() if n in self._subgraph_node_set]
+        if len(self._subgraph_nodes) != len(self._subgraph_node_set):
+            raise NodeNotFoundError(self._subgraph_node_set.difference(self._subgraph_nodes))
 
     def nodes(self) -> Sequence[NodeT]:
         return self._subgraph_nodes
 
     def edges(self) -> List[Edge[EdgeT]]:
-        return [e for e in self._graph.edges() if e.src in self._subgraph_nodes and e.dst in self._subgraph_nodes]
+        node_set = self._subgraph_node_set
+        return [e for e in self._graph.edges() if e.src in node_set and e.dst in node_set]
 
     def in_edges(self, node: NodeT) -> List[Edge[EdgeT]]:
-        if node not in self._subgraph_nodes:
+        if node not in self._subgraph_node_set:
             raise NodeNotFoundError
 
-        return [e for e in self._graph.in_edges(node) if e.src in self._subgraph_nodes]
+        return [e for e in self._graph.in_edges(node) if e.src in self._subgraph_node_set]
 
     def out_edges(self, node: NodeT) -> List[Edge[EdgeT]]:
-        if node not in self._subgraph_nodes:
+        if node not in self._subgraph_node_set:
             raise NodeNotFoundError
 
-        return [e for e in self._graph.out_edges(node) if e.dst in self._subgraph_nodes]
+        return [e for e in self._graph.out_edges(node) if e.dst in self._subgraph_node_set]
 
     def add_node(self, node):
         raise PermissionError
@@ -464,7 +469,7 @@ class SubgraphView(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         raise PermissionError
 
     def node_id(self, node: NodeT) -> int:
-        if node not in self._subgraph_nodes:
+        if node not in self._subgraph_node_set:
             raise NodeNotFoundError
         return self._graph.node_id(node)
 
@@ -481,8 +486,8 @@ class SubgraphView(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         raise PermissionError
 
     def edges_between(self, source, destination):
-        if source not in self._subgraph_nodes or \
-           destination not in self._subgraph_nodes:
+        if source not in self._subgraph_node_set or \
+           destination not in self._subgraph_node_set:
             raise NodeNotFoundError
         return self._graph.edges_between(source, destination)
 
@@ -692,11 +697,19 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[dst][0][t]
         del self._edges[t]
 
+    # The adjacency dictionaries hold one entry per edge, so the degrees are their sizes. Nodes that are not in the
+    # graph keep going through networkx, which some callers (e.g., validation of nested regions) rely on
     def in_degree(self, node):
-        return self._nx.in_degree(node)
+        adjacency = self._nodes.get(node)
+        if adjacency is None:
+            return self._nx.in_degree(node)
+        return len(adjacency[0])
 
     def out_degree(self, node):
-        return self._nx.out_degree(node)
+        adjacency = self._nodes.get(node)
+        if adjacency is None:
+            return self._nx.out_degree(node)
+        return len(adjacency[1])
 
     def number_of_nodes(self):
         return len(self._nodes)
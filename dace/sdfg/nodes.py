@@ -8,7 +8,7 @@ from collections.abc import KeysView
 import dace
 import itertools
 import dace.serialize
-from typing import Any, Dict, Optional, Set, Union
+from typing import Any, Dict, FrozenSet, Optional, Set, Union
 from dace.config import Config
 from dace.sdfg import graph
 from dace.frontend.python.astutils import unparse, rname
@@ -381,11 +381,27 @@ class Tasklet(CodeNode):
         self.side_effects = side_effects
         self.ignored_symbols = ignored_symbols or set()
         self.debuginfo = debuginfo
+        self._called_names_cache = None
 
     @property
     def language(self):
         return self.code.language
 
+    def called_names(self) -> FrozenSet[str]:
+        """
+        Returns the names of all functions that are called by name in the (Python) code of this tasklet.
+        The result is cached for the current code object. Code that modifies the tasklet AST in place must
+        reset ``_called_names_cache``.
+        """
+        code = self.code.code
+        cached = self._called_names_cache
+        if cached is not None and cached[0] is code:
+            return cached[1]
+        names = frozenset(astnode.func.id for stmt in code for astnode in ast.walk(stmt)
+                          if isinstance(astnode, ast.Call) and isinstance(astnode.func, ast.Name))
+        self._called_names_cache = (code, names)
+        return names
+
     @staticmethod
     def from_json(json_obj, context=None):
         ret = Tasklet("dummylabel")
@@ -154,6 +154,8 @@ def replace_properties_dict(node: Any,
                 afr = ASTFindReplace(reduced_repl)
                 for stmt in propval.code:
                     afr.visit(stmt)
+                if isinstance(node, dace.sdfg.nodes.Tasklet):
+                    node._called_names_cache = None
         elif (isinstance(propclass, properties.DictProperty) and pname == 'symbol_mapping'):
             # Symbol mappings for nested SDFGs
             for symname, sym_mapping in propval.items():
@@ -317,13 +317,9 @@ class InterstateEdge(object):
         """
         from dace.codegen.tools.type_inference import infer_expr_type
 
-        if sdfg is not None:
-            alltypes = copy.copy(symbols)
-            alltypes.update({k: v.dtype for k, v in sdfg.arrays.items()})
-        else:
-            alltypes = symbols
-
-        inferred_lhs_symbols = {k: infer_expr_type(v, alltypes) for k, v in self.assignments.items()}
+        # Most inter-state edges do not assign anything, skip building the type dictionary for them
+        if not self.assignments:
+            return {}
 
         # Symbols in assignment keys are candidate newly defined symbols
         lhs_symbols = set()
@@ -335,7 +331,14 @@ class InterstateEdge(object):
             if lhs not in rhs_symbols:
                 lhs_symbols.add(lhs)
 
-        return {k: v for k, v in inferred_lhs_symbols.items() if k in lhs_symbols}
+        if sdfg is not None:
+            alltypes = copy.copy(symbols)
+            alltypes.update({k: v.dtype for k, v in sdfg.arrays.items()})
+        else:
+            alltypes = symbols
+
+        # Only infer the types of the symbols that are returned
+        return {k: infer_expr_type(v, alltypes) for k, v in self.assignments.items() if k in lhs_symbols}
 
     def get_read_memlets(self, arrays: Dict[str, dt.Data]) -> List[mm.Memlet]:
         """
@@ -605,11 +608,12 @@ class SDFG(ControlFlowRegion):
                                                 json_obj,
                                                 ignore_properties={'constants_prop', 'name', 'hash'})
 
+        # States only read from the context, so a single copy is shared by all of them
+        nci = copy.copy(context_info)
+        nci['sdfg'] = ret
+
         nodelist = []
         for n in nodes:
-            nci = copy.copy(context_info)
-            nci['sdfg'] = ret
-
             state = SDFGState.from_json(n, context=nci)
             ret.add_node(state)
             nodelist.append(state)
@@ -1,15 +1,16 @@
 # Copyright 2019-2024 ETH Zurich and the DaCe authors. All rights reserved.
 """ Contains classes of a single SDFG state and dataflow subgraphs. """
 
-import ast
 import abc
 import collections
 import copy
-import inspect
-import itertools
+import functools
+import numbers
+import sys
+import types
 import warnings
-from typing import (TYPE_CHECKING, Any, AnyStr, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union,
-                    overload)
+from typing import (TYPE_CHECKING, Any, AnyStr, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence,
+                    Set, Tuple, Union, overload)
 
 import dace
 import dace.serialize
@@ -46,8 +47,45 @@ def _getdebuginfo(old_dinfo=None) -> dtypes.DebugInfo:
     if old_dinfo is not None:
         return old_dinfo
 
-    caller = inspect.getframeinfo(inspect.stack()[2][0], context=0)
-    return dtypes.DebugInfo(caller.lineno, 0, caller.lineno, 0, caller.filename)
+    # Only the caller's frame is needed; ``inspect.stack`` would materialize (and read source for) the whole stack
+    caller = sys._getframe(2)
+    return dtypes.DebugInfo(caller.f_lineno, 0, caller.f_lineno, 0, caller.f_code.co_filename)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_range_string(prange: str) -> Tuple[symbolic.SymbolicType]:
+    """ Parses a single-dimensional range string (e.g., ``"0:N"``). Cached, as frontends create many maps with
+        identical range strings. The result is an immutable tuple and can be safely shared. """
+    return SubsetProperty.from_string(prange)[0]
+
+
+def _covers(cover: Subset, other: Subset) -> bool:
+    """ Equivalent to ``cover.covers(other)``, but decides dimensions with constant bounds using integer comparisons
+        and only falls back to the symbolic test if some bounds are symbolic. """
+    if isinstance(cover, (sbs.Range, sbs.Indices)) and isinstance(other, (sbs.Range, sbs.Indices)):
+        all_constant = True
+        for rb, re, orb, ore in zip(cover.min_element_approx(), cover.max_element_approx(),
+                                    other.min_element_approx(), other.max_element_approx()):
+            if all(isinstance(v, numbers.Integral) for v in (rb, re, orb, ore)):
+                if rb > orb or re < ore:
+                    return False
+            else:
+                all_constant = False
+        if all_constant:
+            return True
+    return cover.covers(other)
+
+
+def _add_new_connectors(node: nd.Node, in_connectors: Iterable[str], out_connectors: Iterable[str]):
+    """ Adds untyped input and output connectors to a node, skipping names that already exist (like consecutive
+        ``add_in_connector``/``add_out_connector`` calls would), but assigning each connector dictionary only once. """
+    existing = node.in_connectors.keys() | node.out_connectors.keys()
+    new_in = {c: None for c in in_connectors if c not in existing}
+    new_out = {c: None for c in out_connectors if c not in existing}
+    if new_in:
+        node.in_connectors = {**node.in_connectors, **new_in}
+    if new_out:
+        node.out_connectors = {**node.out_connectors, **new_out}
 
 
 def _make_iterators(ndrange):
@@ -66,6 +104,8 @@ def _make_iterators(ndrange):
             rng = prange.ndrange()[0]
         elif isinstance(prange, tuple):
             rng = prange
+        elif isinstance(prange, str):
+            rng = _parse_range_string(prange)
         else:
             rng = SubsetProperty.from_string(prange)[0]
         ranges.append(rng)
@@ -274,10 +314,10 @@ class BlockGraphView(object):
         """
         data_args, scalar_args = self.unordered_arglist(defined_syms, shared_transients)
 
-        # Fill up ordered dictionary
-        result = collections.OrderedDict()
-        for k, v in itertools.chain(sorted(data_args.items()), sorted(scalar_args.items())):
-            result[k] = v
+        # Fill up ordered dictionary (insertion order is preserved by ``dict``)
+        result = {k: data_args[k] for k in sorted(data_args)}
+        for k in sorted(scalar_args):
+            result[k] = scalar_args[k]
 
         return result
 
@@ -344,22 +384,29 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
     # Traversal methods
 
     def all_nodes_recursive(self, predicate = None) -> Iterator[Tuple[NodeT, GraphT]]:
-        for node in self.nodes():
+        # Hoist the attribute lookups out of the (potentially long) node loop
+        nodes = self.nodes()
+        nested_sdfg_type = nd.NestedSDFG
+        for node in nodes:
             yield node, self
-            if isinstance(node, nd.NestedSDFG):
+            if isinstance(node, nested_sdfg_type):
                 if predicate is None or predicate(node, self):
-                    yield from node.sdfg.all_nodes_recursive()
+                    yield from node.sdfg.all_nodes_recursive(predicate)
 
     def all_edges_recursive(self) -> Iterator[Tuple[EdgeT, GraphT]]:
         for e in self.edges():
             yield e, self
+        nested_sdfg_type = nd.NestedSDFG
         for node in self.nodes():
-            if isinstance(node, nd.NestedSDFG):
+            if isinstance(node, nested_sdfg_type):
                 yield from node.sdfg.all_edges_recursive()
 
     def data_nodes(self) -> List[nd.AccessNode]:
         """ Returns all data_nodes (arrays) present in this state. """
-        return [n for n in self.nodes() if isinstance(n, nd.AccessNode)]
+        # The filtered list is cached until the graph mutates (see ``_clear_scopedict_cache``)
+        if self._data_nodes_cached is None:
+            self._data_nodes_cached = tuple(n for n in self.nodes() if isinstance(n, nd.AccessNode))
+        return list(self._data_nodes_cached)
 
     def entry_node(self, node: nd.Node) -> Optional[nd.EntryNode]:
         """ Returns the entry node that wraps the current node, or None if
@@ -403,7 +450,7 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
                 if curedge.src_conn is None:
                     raise ValueError("Source connector cannot be None for {}".format(curedge.src))
                 assert curedge.src_conn.startswith("OUT_")
-                next_edge = next(e for e in state.in_edges(curedge.src) if e.dst_conn == "IN_" + curedge.src_conn[4:])
+                next_edge = state._edge_by_connector(curedge.src, "IN_" + curedge.src_conn[4:], True)
                 result.insert(0, next_edge)
                 curedge = next_edge
                 if curedge in visited:
@@ -420,7 +467,7 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
                     raise ValueError("Destination connector cannot be None for {}".format(curedge.dst))
                 if not curedge.dst_conn.startswith("IN_"):  # Map variable
                     break
-                next_edge = next(e for e in state.out_edges(curedge.dst) if e.src_conn == "OUT_" + curedge.dst_conn[3:])
+                next_edge = state._edge_by_connector(curedge.dst, "OUT_" + curedge.dst_conn[3:], False)
                 result.append(next_edge)
                 curedge = next_edge
                 if curedge in visited:
@@ -454,7 +501,7 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
                 visited.add(curedge)
                 assert curedge.src_conn.startswith('OUT_')
                 cname = curedge.src_conn[4:]
-                curedge = next(e for e in state.in_edges(curedge.src) if e.dst_conn == 'IN_%s' % cname)
+                curedge = state._edge_by_connector(curedge.src, 'IN_%s' % cname, True)
                 if curedge in visited:
                     raise ValueError('Cycle encountered while reading memlet path')
         elif propagate_backward:
@@ -462,59 +509,93 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
                 visited.add(curedge)
                 assert curedge.dst_conn.startswith('IN_')
                 cname = curedge.dst_conn[3:]
-                curedge = next(e for e in state.out_edges(curedge.dst) if e.src_conn == 'OUT_%s' % cname)
+                curedge = state._edge_by_connector(curedge.dst, 'OUT_%s' % cname, False)
                 if curedge in visited:
                     raise ValueError('Cycle encountered while reading memlet path')
         tree_root = mm.MemletTree(curedge, downwards=propagate_forward)
 
-        # Collect children (recursively)
-        def add_children(treenode):
+        # Collect children with an explicit work-stack (deep scope nests would otherwise exceed the recursion
+        # limit), recording the tree node that corresponds to the given edge along the way
+        state_in_edges = state.in_edges
+        state_out_edges = state.out_edges
+        entry_node_type = nd.EntryNode
+        exit_node_type = nd.ExitNode
+        found = None
+        stack = [tree_root]
+        while stack:
+            treenode = stack.pop()
+            tree_edge = treenode.edge
+            if found is None and tree_edge is edge:
+                found = treenode
             if propagate_forward:
-                if not (isinstance(treenode.edge.dst, nd.EntryNode) and treenode.edge.dst_conn
-                        and treenode.edge.dst_conn.startswith('IN_')):
-                    return
-                conn = treenode.edge.dst_conn[3:]
+                if not (isinstance(tree_edge.dst, entry_node_type) and tree_edge.dst_conn
+                        and tree_edge.dst_conn.startswith('IN_')):
+                    continue
+                conn = 'OUT_' + tree_edge.dst_conn[3:]
                 treenode.children = [
-                    mm.MemletTree(e, downwards=True, parent=treenode) for e in state.out_edges(treenode.edge.dst)
-                    if e.src_conn == 'OUT_%s' % conn
+                    mm.MemletTree(e, downwards=True, parent=treenode) for e in state_out_edges(tree_edge.dst)
+                    if e.src_conn == conn
                 ]
-            elif propagate_backward:
-                if (not isinstance(treenode.edge.src, nd.ExitNode) or treenode.edge.src_conn is None):
-                    return
-                conn = treenode.edge.src_conn[4:]
+            else:
+                if (not isinstance(tree_edge.src, exit_node_type) or tree_edge.src_conn is None):
+                    continue
+                conn = 'IN_' + tree_edge.src_conn[4:]
                 treenode.children = [
-                    mm.MemletTree(e, downwards=False, parent=treenode) for e in state.in_edges(treenode.edge.src)
-                    if e.dst_conn == 'IN_%s' % conn
+                    mm.MemletTree(e, downwards=False, parent=treenode) for e in state_in_edges(tree_edge.src)
+                    if e.dst_conn == conn
                 ]
-
-            for child in treenode.children:
-                add_children(child)
-
-        # Start from root node (obtained from above parent traversal)
-        add_children(tree_root)
-
-        # Find edge in tree
-        def traverse(node):
-            if node.edge == edge:
-                return node
-            for child in node.children:
-                res = traverse(child)
-                if res is not None:
-                    return res
-            return None
+            stack.extend(treenode.children)
 
         # Return node that corresponds to current edge
-        return traverse(tree_root)
-
+        return found
+
+    def _edge_by_connector(self, node: nd.Node, connector: str, incoming: bool) -> MultiConnectorEdge[mm.Memlet]:
+        """
+        Returns the first incoming (or outgoing) edge of a node that is attached to the given connector. Used for
+        O(1) hops when tracing memlets through scope nodes.
+
+        The per-node connector index is built lazily and reset with the scope caches whenever the graph mutates.
+        Hits are re-validated against the edge's current connector, since connectors may be renamed in place.
+
+        :param node: The node to look up the edge on.
+        :param connector: Name of the connector.
+        :param incoming: If True, looks up the in-edges of ``node``, otherwise its out-edges.
+        :return: The matching edge.
+        :raise StopIteration: If no edge is attached to the given connector.
+        """
+        if self._connector_edge_index is None:
+            self._connector_edge_index = {}
+        index = self._connector_edge_index
+        conns = index.get((node, incoming))
+        if conns is not None:
+            edge = conns.get(connector)
+            if edge is not None and (edge.dst_conn if incoming else edge.src_conn) == connector:
+                return edge
+
+        # (Re)build the index for this node, keeping the first edge per connector
+        conns = {}
+        if incoming:
+            for e in self.in_edges(node):
+                conns.setdefault(e.dst_conn, e)
+        else:
+            for e in self.out_edges(node):
+                conns.setdefault(e.src_conn, e)
+        index[(node, incoming)] = conns
+        if connector not in conns:
+            raise StopIteration
+        return conns[connector]
+
+    # NOTE: The edges are collected eagerly with a list comprehension (cheaper than a generator), but returned as an
+    #       iterator, since many callers take the first edge with ``next(...)``.
     def in_edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        return (e for e in self.in_edges(node) if e.dst_conn == connector)
+        return iter([e for e in self.in_edges(node) if e.dst_conn == connector])
 
     def out_edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        return (e for e in self.out_edges(node) if e.src_conn == connector)
+        return iter([e for e in self.out_edges(node) if e.src_conn == connector])
 
     def edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        return itertools.chain(self.in_edges_by_connector(node, connector),
-                               self.out_edges_by_connector(node, connector))
+        return iter([e for e in self.in_edges(node) if e.dst_conn == connector] +
+                    [e for e in self.out_edges(node) if e.src_conn == connector])
 
     ###################################################################
     # Scope-related methods
@@ -528,48 +609,72 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         self._scope_dict_tochildren_cached = None
         self._scope_tree_cached = None
         self._scope_leaves_cached = None
+        self._connector_edge_index = None
+        self._data_nodes_cached = None
 
-    def scope_tree(self) -> 'dace.sdfg.scope.ScopeTree':
+    def scope_tree(self, copy: bool = False) -> Mapping[Optional[nd.EntryNode], 'dace.sdfg.scope.ScopeTree']:
+        """
+        Returns a mapping from each scope entry node (or None for the top-level scope) to its scope tree node.
+
+        :param copy: If True, returns a mutable shallow copy of the mapping instead of a read-only view of the cache.
+        """
         from dace.sdfg.scope import ScopeTree
 
+        # Like ``scope_dict``, returns a read-only view of the cache unless a copy is requested
         if (hasattr(self, '_scope_tree_cached') and self._scope_tree_cached is not None):
-            return copy.copy(self._scope_tree_cached)
+            if copy:
+                return dict(self._scope_tree_cached)
+            return types.MappingProxyType(self._scope_tree_cached)
 
-        sdp = self.scope_dict()
         sdc = self.scope_children()
 
-        result = {}
-
         # Get scopes
-        for node, scopenodes in sdc.items():
-            if node is None:
-                exit_node = None
-            else:
-                exit_node = next(v for v in scopenodes if isinstance(v, nd.ExitNode))
-            scope = ScopeTree(node, exit_node)
-            result[node] = scope
+        result = {node: ScopeTree(node, None) for node in sdc}
 
-        # Scope parents and children
-        for node, scope in result.items():
-            if node is not None:
-                scope.parent = result[sdp[node]]
-            scope.children = [result[n] for n in sdc[node] if isinstance(n, nd.EntryNode)]
+        # Scope exits, parents, and children, classifying the nodes of each scope in a single pass
+        for node, scopenodes in sdc.items():
+            scope = result[node]
+            children = scope.children
+            for v in scopenodes:
+                if isinstance(v, nd.EntryNode):
+                    child = result[v]
+                    child.parent = scope
+                    children.append(child)
+                elif scope.exit is None and isinstance(v, nd.ExitNode):
+                    scope.exit = v
+            if node is not None and scope.exit is None:
+                raise ValueError('Scope of %s has no exit node' % node)
 
         self._scope_tree_cached = result
 
-        return copy.copy(self._scope_tree_cached)
+        if copy:
+            return dict(result)
+        return types.MappingProxyType(result)
 
-    def scope_leaves(self) -> List['dace.sdfg.scope.ScopeTree']:
-        if (hasattr(self, '_scope_leaves_cached') and self._scope_leaves_cached is not None):
-            return copy.copy(self._scope_leaves_cached)
-        st = self.scope_tree()
-        self._scope_leaves_cached = [scope for scope in st.values() if len(scope.children) == 0]
-        return copy.copy(self._scope_leaves_cached)
+    def scope_leaves(self, copy: bool = False) -> Sequence['dace.sdfg.scope.ScopeTree']:
+        """
+        Returns the scope tree nodes that have no child scopes.
+
+        :param copy: If True, returns a mutable list instead of the cached tuple.
+        """
+        if (not hasattr(self, '_scope_leaves_cached') or self._scope_leaves_cached is None):
+            st = self.scope_tree()
+            self._scope_leaves_cached = tuple(scope for scope in st.values() if len(scope.children) == 0)
+        if copy:
+            return list(self._scope_leaves_cached)
+        return self._scope_leaves_cached
+
+    def scope_dict(self,
+                   return_ids: bool = False,
+                   validate: bool = True) -> Mapping[nd.Node, Union['SDFGState', nd.Node]]:
+        """
+        Returns a mapping from each node in the state to the entry node of its parent scope (None if top-level).
 
-    def scope_dict(self, return_ids: bool = False, validate: bool = True) -> Dict[nd.Node, Union['SDFGState', nd.Node]]:
+        :note: The result is a read-only view of a cache that is invalidated when the state changes. Use ``dict(...)``
+               to obtain a mutable copy.
+        """
         from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        result = copy.copy(self._scope_dict_toparent_cached)
+        result = self._scope_dict_toparent_cached
 
         if result is None:
             result = {}
@@ -592,19 +697,24 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
 
             # Cache result
             self._scope_dict_toparent_cached = result
-            result = copy.copy(result)
 
         if return_ids:
             return _scope_dict_to_ids(self, result)
-        return result
+        # Hand out a read-only view of the cache rather than copying it on every call. The cache is invalidated via
+        # ``_clear_scopedict_cache`` whenever the graph changes
+        return types.MappingProxyType(result)
 
     def scope_children(self,
                        return_ids: bool = False,
-                       validate: bool = True) -> Dict[Union[nd.Node, 'SDFGState'], List[nd.Node]]:
+                       validate: bool = True) -> Mapping[Union[nd.Node, 'SDFGState'], List[nd.Node]]:
+        """
+        Returns a mapping from each scope entry node (or None for the top-level scope) to the nodes in that scope.
+
+        :note: The result is a read-only view of a cache that is invalidated when the state changes. The lists it
+               contains are the cached lists themselves and must not be mutated; copy them before modifying.
+        """
         from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        if self._scope_dict_tochildren_cached is not None:
-            result = copy.copy(self._scope_dict_tochildren_cached)
+        result = self._scope_dict_tochildren_cached
 
         if result is None:
             result = {}
@@ -627,11 +737,11 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
 
             # Cache result
             self._scope_dict_tochildren_cached = result
-            result = copy.copy(result)
 
         if return_ids:
             return _scope_dict_to_ids(self, result)
-        return result
+        # Read-only view of the cache, see ``scope_dict``
+        return types.MappingProxyType(result)
 
     ###################################################################
     # Query, subgraph, and replacement methods
@@ -648,47 +758,46 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         sdfg = state.sdfg
         new_symbols = set()
         freesyms = set()
+        sdfg_symbols = sdfg.symbols.keys()
+        python = dtypes.Language.Python
 
         # Free symbols from nodes
         for n in self.nodes():
             if isinstance(n, nd.EntryNode):
-                new_symbols |= set(n.new_symbols(sdfg, self, {}).keys())
+                new_symbols.update(n.new_symbols(sdfg, self, {}).keys())
             elif isinstance(n, nd.AccessNode):
                 # Add data descriptor symbols
-                freesyms |= set(map(str, n.desc(sdfg).used_symbols(all_symbols)))
+                freesyms.update(map(str, n.desc(sdfg).used_symbols(all_symbols)))
             elif isinstance(n, nd.Tasklet):
-                if n.language == dtypes.Language.Python:
+                if n.language == python:
                     # Consider callbacks defined as symbols as free
-                    for stmt in n.code.code:
-                        for astnode in ast.walk(stmt):
-                            if (isinstance(astnode, ast.Call) and isinstance(astnode.func, ast.Name)
-                                    and astnode.func.id in sdfg.symbols):
-                                freesyms.add(astnode.func.id)
+                    freesyms |= n.called_names() & sdfg_symbols
                 else:
                     # Find all string tokens and filter them to sdfg.symbols, while ignoring connectors
                     codesyms = symbolic.symbols_in_code(
                         n.code.as_string,
-                        potential_symbols=sdfg.symbols.keys(),
+                        potential_symbols=sdfg_symbols,
                         symbols_to_ignore=(n.in_connectors.keys() | n.out_connectors.keys() | n.ignored_symbols),
                     )
                     freesyms |= codesyms
                     continue
 
-            if hasattr(n, 'used_symbols'):
-                freesyms |= n.used_symbols(all_symbols)
+            node_used_symbols = getattr(n, 'used_symbols', None)
+            if node_used_symbols is not None:
+                freesyms |= node_used_symbols(all_symbols)
             else:
                 freesyms |= n.free_symbols
 
-        # Free symbols from memlets
-        for e in self.edges():
-            # If used for code generation, only consider memlet tree leaves
-            if not all_symbols and not self.is_leaf_memlet(e):
-                continue
-
+        # Free symbols from memlets. If used for code generation, only consider memlet tree leaves
+        edges = self.edges()
+        if not all_symbols:
+            is_leaf_memlet = self.is_leaf_memlet
+            edges = [e for e in edges if is_leaf_memlet(e)]
+        for e in edges:
             freesyms |= e.data.used_symbols(all_symbols, e)
 
         # Do not consider SDFG constants as symbols
-        new_symbols.update(set(sdfg.constants.keys()))
+        new_symbols.update(sdfg.constants.keys())
         return freesyms - new_symbols
 
     @property
@@ -711,7 +820,7 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         sdfg = state.sdfg
 
         # Start with SDFG global symbols
-        defined_syms = {k: v for k, v in sdfg.symbols.items()}
+        defined_syms = dict(sdfg.symbols)
 
         def update_if_not_none(dic, update):
             update = {k: v for k, v in update.items() if v is not None}
@@ -727,16 +836,22 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         for edge in sdfg.dfs_edges(sdfg.start_state):
             update_if_not_none(defined_syms, edge.data.new_symbols(sdfg, defined_syms))
 
-        # Add scope symbols all the way to the subgraph
+        # Add scope symbols all the way to the subgraph, outermost scopes first. Source nodes are visited in reverse
+        # order and each climb stops at the first scope that was already collected (whose ancestors then are, too),
+        # so every scope chain is only walked once
         sdict = state.scope_dict()
         scope_nodes = []
-        for source_node in self.source_nodes():
-            curnode = source_node
-            while sdict[curnode] is not None:
+        visited = set()
+        for source_node in reversed(self.source_nodes()):
+            chain = []
+            curnode = sdict[source_node]
+            while curnode is not None and curnode not in visited:
+                visited.add(curnode)
+                chain.append(curnode)
                 curnode = sdict[curnode]
-                scope_nodes.append(curnode)
+            scope_nodes.extend(reversed(chain))
 
-        for snode in dtypes.deduplicate(list(reversed(scope_nodes))):
+        for snode in scope_nodes:
             update_if_not_none(defined_syms, snode.new_symbols(sdfg, state, defined_syms))
 
         return defined_syms
@@ -753,31 +868,32 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         for sg in subgraphs:
             rs = collections.defaultdict(list)
             ws = collections.defaultdict(list)
-            # Traverse in topological order, so data that is written before it
-            # is read is not counted in the read set
-            for n in utils.dfs_topological_sort(sg, sources=sg.source_nodes()):
+            # Data that is written before it is read is not counted in the read set. This is decided per access
+            # node (based on its own in- and out-edges), so only access nodes need to be visited and no
+            # topological order is necessary
+            for n in sg.nodes():
                 if isinstance(n, nd.AccessNode):
                     in_edges = sg.in_edges(n)
                     out_edges = sg.out_edges(n)
-                    # Filter out memlets which go out but the same data is written to the AccessNode by another memlet
-                    for out_edge in list(out_edges):
-                        for in_edge in list(in_edges):
-                            if (in_edge.data.data == out_edge.data.data
-                                    and in_edge.data.dst_subset.covers(out_edge.data.src_subset)):
-                                out_edges.remove(out_edge)
-                                break
-
-                    for e in in_edges:
-                        # skip empty memlets
-                        if e.data.is_empty():
-                            continue
-                        # Store all subsets that have been written
-                        ws[n.data].append(e.data.subset)
-                    for e in out_edges:
-                        # skip empty memlets
-                        if e.data.is_empty():
-                            continue
-                        rs[n.data].append(e.data.subset)
+                    # Filter out memlets which go out but the same data is written to the AccessNode by another memlet.
+                    # Only in-edges of the same data container need to be checked for coverage
+                    in_edges_by_data = collections.defaultdict(list)
+                    for in_edge in in_edges:
+                        in_edges_by_data[in_edge.data.data].append(in_edge)
+                    out_edges = [
+                        out_edge for out_edge in out_edges
+                        if not any(_covers(in_edge.data.dst_subset, out_edge.data.src_subset)
+                                   for in_edge in in_edges_by_data.get(out_edge.data.data, ()))
+                    ]
+
+                    # Store all subsets that have been written and read, skipping empty memlets. Containers
+                    # without any non-empty access must not appear as keys
+                    written = [e.data.subset for e in in_edges if not e.data.is_empty()]
+                    if written:
+                        ws[n.data].extend(written)
+                    read = [e.data.subset for e in out_edges if not e.data.is_empty()]
+                    if read:
+                        rs[n.data].extend(read)
             # Union all subgraphs, so an array that was excluded from the read
             # set because it was written first is still included if it is read
             # in another subgraph
@@ -813,16 +929,19 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
         scalars_with_nodes = set()
         for node in self.nodes():
             if isinstance(node, nd.AccessNode):
-                descs[node.data] = node.desc(sdfg)
+                desc = node.desc(sdfg)
+                descs[node.data] = desc
                 descs_with_nodes[node.data] = node
-                if isinstance(node.desc(sdfg), dt.Scalar):
+                if isinstance(desc, dt.Scalar):
                     scalars_with_nodes.add(node.data)
 
         # If a subgraph, and a node appears outside the subgraph as well,
         # it is externally allocated
         if isinstance(self, SubgraphView):
-            outer_nodes = set(self.graph.nodes()) - set(self.nodes())
-            for node in outer_nodes:
+            inner_nodes = set(self.nodes())
+            for node in self.graph.nodes():
+                if node in inner_nodes:
+                    continue
                 if isinstance(node, nd.AccessNode) and node.data in descs:
                     desc = descs[node.data]
                     if isinstance(desc, dt.Scalar):
@@ -832,17 +951,19 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
 
         # Add data arguments from memlets, if do not appear in any of the nodes
         # (i.e., originate externally)
+        arrays = sdfg.arrays
         for edge in self.edges():
-            if edge.data.data is not None and edge.data.data not in descs:
-                desc = sdfg.arrays[edge.data.data]
+            data = edge.data.data
+            if data is not None and data not in descs:
+                desc = arrays[data]
                 if isinstance(desc, dt.Scalar):
                     # Ignore code->code edges.
                     if (isinstance(edge.src, nd.CodeNode) and isinstance(edge.dst, nd.CodeNode)):
                         continue
 
-                    scalar_args[edge.data.data] = desc
+                    scalar_args[data] = desc
                 else:
-                    data_args[edge.data.data] = desc
+                    data_args[data] = desc
 
         # Loop over locally-used data descriptors
         for name, desc in descs.items():
@@ -880,20 +1001,28 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
                         data_args[name] = desc
         # End of data descriptor loop
 
-        # Add scalar arguments from free symbols
-        defined_syms = defined_syms or self.defined_symbols()
-        scalar_args.update({
-            k: dt.Scalar(defined_syms[k]) if k in defined_syms else sdfg.arrays[k]
-            for k in self.used_symbols(all_symbols=False) if not k.startswith('__dace') and k not in sdfg.constants
-        })
-
-        # Add scalar arguments from free symbols of data descriptors
+        # Add scalar arguments from free symbols. ``SDFG.constants`` is recomputed on every access, so its names are
+        # fetched once and filtered out with a set difference
+        constant_names = sdfg.constants.keys()
+        used_syms = {k for k in self.used_symbols(all_symbols=False) if not k.startswith('__dace')} - constant_names
+        if used_syms:
+            # Defined symbols are only needed to type the used ones, and are expensive to collect
+            defined_syms = defined_syms or self.defined_symbols()
+            scalar_args.update(
+                {k: dt.Scalar(defined_syms[k]) if k in defined_syms else sdfg.arrays[k]
+                 for k in used_syms})
+
+        # Add scalar arguments from free symbols of data descriptors (each descriptor is only inspected once, even if
+        # it is registered under several names)
+        visited_descs = set()
         for arg in data_args.values():
-            scalar_args.update({
-                str(k): dt.Scalar(k.dtype)
-                for k in arg.used_symbols(all_symbols=False)
-                if not str(k).startswith('__dace') and str(k) not in sdfg.constants
-            })
+            if id(arg) in visited_descs:
+                continue
+            visited_descs.add(id(arg))
+            for k in arg.used_symbols(all_symbols=False):
+                name = str(k)
+                if not name.startswith('__dace') and name not in constant_names:
+                    scalar_args[name] = dt.Scalar(k.dtype)
 
         return data_args, scalar_args
 
@@ -924,8 +1053,10 @@ class DataflowGraphView(BlockGraphView, abc.ABC):
 
     def all_transients(self) -> List[str]:
         """Iterate over all transients in this state."""
-        return dtypes.deduplicate(
-            [n.data for n in self.nodes() if isinstance(n, nd.AccessNode) and n.desc(self.sdfg).transient])
+        sdfg = self.sdfg
+        # Deduplicate preserving order (``dict`` keys keep insertion order)
+        return list(
+            dict.fromkeys(n.data for n in self.nodes() if isinstance(n, nd.AccessNode) and n.desc(sdfg).transient))
 
     def replace(self, name: str, new_name: str):
         """ Finds and replaces all occurrences of a symbol or array in this
@@ -965,7 +1096,7 @@ class ControlGraphView(BlockGraphView, abc.ABC):
         for node in self.nodes():
             yield node, self
             if predicate is None or predicate(node, self):
-                yield from node.all_nodes_recursive()
+                yield from node.all_nodes_recursive(predicate)
 
     def all_edges_recursive(self) -> Iterator[Tuple[EdgeT, GraphT]]:
         for e in self.edges():
@@ -979,49 +1110,67 @@ class ControlGraphView(BlockGraphView, abc.ABC):
             data_nodes.extend(node.data_nodes())
         return data_nodes
 
-    def entry_node(self, node: nd.Node) -> Optional[nd.EntryNode]:
+    def _block_of(self, node: Union[nd.Node, 'ControlFlowBlock']) -> Optional['ControlFlowBlock']:
+        """
+        Returns the block of this graph that directly contains the given node, or None if there is none.
+        The lookup goes through a lazily built index, whose hits are checked against the current graph so that
+        blocks modified in the meantime never yield a stale result.
+        """
+        index = self._node_to_block_cache
+        if index is not None:
+            block = index.get(node)
+            if block is not None and block in self._nodes and node in block._nodes:
+                return block
+        index = {}
         for block in self.nodes():
-            if node in block.nodes():
-                return block.exit_node(node)
+            for n in block.nodes():
+                index.setdefault(n, block)
+        self._node_to_block_cache = index
+        return index.get(node)
+
+    def entry_node(self, node: nd.Node) -> Optional[nd.EntryNode]:
+        block = self._block_of(node)
+        if block is not None:
+            return block.entry_node(node)
         return None
 
     def exit_node(self, entry_node: nd.EntryNode) -> Optional[nd.ExitNode]:
-        for block in self.nodes():
-            if entry_node in block.nodes():
-                return block.exit_node(entry_node)
+        block = self._block_of(entry_node)
+        if block is not None:
+            return block.exit_node(entry_node)
         return None
 
     ###################################################################
     # Memlet-tracking methods
 
     def memlet_path(self, edge: MultiConnectorEdge[mm.Memlet]) -> List[MultiConnectorEdge[mm.Memlet]]:
-        for block in self.nodes():
-            if edge in block.edges():
-                return block.memlet_path(edge)
+        block = self._block_of(edge.src)
+        if block is not None and edge in block._edges:
+            return block.memlet_path(edge)
         return []
 
     def memlet_tree(self, edge: MultiConnectorEdge) -> mm.MemletTree:
-        for block in self.nodes():
-            if edge in block.edges():
-                return block.memlet_tree(edge)
+        block = self._block_of(edge.src)
+        if block is not None and edge in block._edges:
+            return block.memlet_tree(edge)
         return mm.MemletTree(edge)
 
     def in_edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        for block in self.nodes():
-            if node in block.nodes():
-                return block.in_edges_by_connector(node, connector)
+        block = self._block_of(node)
+        if block is not None:
+            return block.in_edges_by_connector(node, connector)
         return []
 
     def out_edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        for block in self.nodes():
-            if node in block.nodes():
-                return block.out_edges_by_connector(node, connector)
+        block = self._block_of(node)
+        if block is not None:
+            return block.out_edges_by_connector(node, connector)
         return []
 
     def edges_by_connector(self, node: nd.Node, connector: AnyStr) -> Iterable[MultiConnectorEdge[mm.Memlet]]:
-        for block in self.nodes():
-            if node in block.nodes():
-                return block.edges_by_connector(node, connector)
+        block = self._block_of(node)
+        if block is not None:
+            return block.edges_by_connector(node, connector)
 
     ###################################################################
     # Query, subgraph, and replacement methods
@@ -1041,9 +1190,10 @@ class ControlGraphView(BlockGraphView, abc.ABC):
     def read_and_write_sets(self) -> Tuple[Set[AnyStr], Set[AnyStr]]:
         read_set = set()
         write_set = set()
+        arr_keys = self.sdfg.arrays.keys()
         for block in self.nodes():
             for edge in self.in_edges(block):
-                read_set |= edge.data.free_symbols & self.sdfg.arrays.keys()
+                read_set |= edge.data.free_symbols & arr_keys
             rs, ws = block.read_and_write_sets()
             read_set.update(rs)
             write_set.update(ws)
@@ -1067,10 +1217,11 @@ class ControlGraphView(BlockGraphView, abc.ABC):
         return res
 
     def all_transients(self) -> List[str]:
-        res = []
+        # Deduplicate preserving order (``dict`` keys keep insertion order)
+        res = {}
         for block in self.nodes():
-            res.extend(block.all_transients())
-        return dtypes.deduplicate(res)
+            res.update(dict.fromkeys(block.all_transients()))
+        return list(res)
 
     def replace(self, name: str, new_name: str):
         for n in self.nodes():
@@ -1150,16 +1301,12 @@ class ControlFlowBlock(BlockGraphView, abc.ABC):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if k in ('_parent_graph', '_sdfg'):  # Skip derivative attributes
-                continue
-            setattr(result, k, copy.deepcopy(v, memo))
+        # Copy all attributes in one call, skipping derivative attributes
+        attrs = {k: v for k, v in self.__dict__.items() if k not in ('_parent_graph', '_sdfg')}
+        result.__dict__.update(copy.deepcopy(attrs, memo))
 
         for k in ('_parent_graph', '_sdfg'):
-            if id(getattr(self, k)) in memo:
-                setattr(result, k, memo[id(getattr(self, k))])
-            else:
-                setattr(result, k, None)
+            result.__dict__[k] = memo.get(id(getattr(self, k)))
 
         return result
 
@@ -1169,6 +1316,9 @@ class ControlFlowBlock(BlockGraphView, abc.ABC):
 
     @label.setter
     def label(self, label: str):
+        if label != self._label and self._parent_graph is not None:
+            # Renaming makes the parent's cached label set stale
+            self._parent_graph._labels = None
         self._label = label
 
     @property
@@ -1446,7 +1596,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
         # Start with global symbols
         symbols = collections.OrderedDict(sdfg.symbols)
         for desc in sdfg.arrays.values():
-            symbols.update([(str(s), s.dtype) for s in desc.free_symbols])
+            symbols.update((str(s), s.dtype) for s in desc.free_symbols)
 
         # Add symbols from inter-state edges along the path to the state
         try:
@@ -1459,13 +1609,13 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             for e in sdfg.edges():
                 symbols.update(e.data.new_symbols(sdfg, symbols))
 
-        # Find scopes this node is situated in
+        # Find scopes this node is situated in (the scope dictionary is cached, so this is a walk over parents)
         sdict = self.scope_dict()
         scope_list = []
-        curnode = node
-        while sdict[curnode] is not None:
-            curnode = sdict[curnode]
+        curnode = sdict[node]
+        while curnode is not None:
             scope_list.append(curnode)
+            curnode = sdict[curnode]
 
         # Add the scope symbols top-down
         for scope_node in reversed(scope_list):
@@ -1609,28 +1759,41 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
 
         # Add "default" undefined symbols if None are given
         symbols = sdfg.free_symbols
+        mapping_changed = False
         if symbol_mapping is None:
             symbol_mapping = {s: s for s in symbols}
-            s.symbol_mapping = symbol_mapping
+            mapping_changed = True
 
         # Validate missing symbols
-        missing_symbols = [s for s in symbols if s not in symbol_mapping]
+        missing_symbols = set(symbols) - symbol_mapping.keys()
         if missing_symbols and parent:
             # If symbols are missing, try to get them from the parent SDFG
-            parent_mapping = {s: s for s in missing_symbols if s in parent.symbols}
-            symbol_mapping.update(parent_mapping)
+            parent_mapping = {s: s for s in missing_symbols & parent.symbols.keys()}
+            if parent_mapping:
+                symbol_mapping.update(parent_mapping)
+                mapping_changed = True
+                missing_symbols -= parent_mapping.keys()
+
+        # The property setter converts the whole mapping, so it is only invoked once and only if needed
+        if mapping_changed:
             s.symbol_mapping = symbol_mapping
-            missing_symbols = [s for s in symbols if s not in symbol_mapping]
         if missing_symbols:
-            raise ValueError('Missing symbols on nested SDFG "%s": %s' % (name, missing_symbols))
+            raise ValueError('Missing symbols on nested SDFG "%s": %s' % (name, sorted(missing_symbols)))
 
         # Add new global symbols to nested SDFG
         from dace.codegen.tools.type_inference import infer_expr_type
+        parent_symbols = self.sdfg.symbols
         for sym, symval in s.symbol_mapping.items():
             if sym not in sdfg.symbols:
-                # TODO: Think of a better way to avoid calling
-                # symbols_defined_at in this moment
-                sdfg.add_symbol(sym, infer_expr_type(symval, self.sdfg.symbols) or dtypes.typeclass(int))
+                # Symbols mapped directly to a parent symbol take its type, without going through type inference
+                dtype = None
+                if isinstance(symval, (str, symbolic.symbol)):
+                    dtype = parent_symbols.get(str(symval))
+                if not isinstance(dtype, dtypes.typeclass):
+                    # TODO: Think of a better way to avoid calling
+                    # symbols_defined_at in this moment
+                    dtype = infer_expr_type(symval, parent_symbols)
+                sdfg.add_symbol(sym, dtype or dtypes.typeclass(int))
 
         return s
 
@@ -1772,28 +1935,33 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
         if external_edges:
             input_nodes = input_nodes or {}
             output_nodes = output_nodes or {}
-            input_data = dtypes.deduplicate([memlet.data for memlet in inputs.values()])
-            output_data = dtypes.deduplicate([memlet.data for memlet in outputs.values()])
+            input_data = {memlet.data for memlet in inputs.values()}
+            output_data = {memlet.data for memlet in outputs.values()}
+            # Fill in sorted order, so that the dictionaries can be iterated deterministically below without resorting
+            # New access nodes share the (already resolved) debug information of the mapped tasklet
             for inp in sorted(input_data):
                 if inp in input_nodes:
                     inpdict[inp] = input_nodes[inp]
                 else:
-                    inpdict[inp] = self.add_read(inp)
+                    inpdict[inp] = self.add_read(inp, debuginfo=debuginfo)
             for out in sorted(output_data):
                 if out in output_nodes:
                     outdict[out] = output_nodes[out]
                 else:
-                    outdict[out] = self.add_write(out)
+                    outdict[out] = self.add_write(out, debuginfo=debuginfo)
 
         edges: List[Edge[dace.Memlet]] = []
 
         # Connect inputs from map to tasklet
         tomemlet = {}
+        internal_edges = collections.defaultdict(list)
         for name, memlet in sorted(inputs.items()):
             # Set memlet local name
             memlet.name = name
             # Add internal memlet edge
-            edges.append(self.add_edge(map_entry, None, tasklet, name, memlet))
+            edge = self.add_edge(map_entry, None, tasklet, name, memlet)
+            edges.append(edge)
+            internal_edges[memlet.data].append(edge)
             tomemlet[memlet.data] = memlet
 
         # If there are no inputs, add empty memlet
@@ -1801,7 +1969,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             self.add_edge(map_entry, None, tasklet, None, mm.Memlet())
 
         if external_edges:
-            for inp, inpnode in sorted(inpdict.items()):
+            for inp, inpnode in inpdict.items():
                 # Add external edge
                 if propagate:
                     outer_memlet = propagate_memlet(self, tomemlet[inp], map_entry, True)
@@ -1810,21 +1978,23 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
                 edges.append(self.add_edge(inpnode, None, map_entry, "IN_" + inp, outer_memlet))
 
                 # Add connectors to internal edges
-                for e in self.out_edges(map_entry):
-                    if e.data.data == inp:
-                        e._src_conn = "OUT_" + inp
+                for e in internal_edges[inp]:
+                    e._src_conn = "OUT_" + inp
 
-                # Add connectors to map entry
-                map_entry.add_in_connector("IN_" + inp)
-                map_entry.add_out_connector("OUT_" + inp)
+            # Add connectors to map entry (all at once, as each connector update copies the connector dictionary)
+            map_entry.in_connectors = {**map_entry.in_connectors, **{"IN_" + inp: None for inp in inpdict}}
+            map_entry.out_connectors = {**map_entry.out_connectors, **{"OUT_" + inp: None for inp in inpdict}}
 
         # Connect outputs from tasklet to map
         tomemlet = {}
+        internal_edges = collections.defaultdict(list)
         for name, memlet in sorted(outputs.items()):
             # Set memlet local name
             memlet.name = name
             # Add internal memlet edge
-            edges.append(self.add_edge(tasklet, name, map_exit, None, memlet))
+            edge = self.add_edge(tasklet, name, map_exit, None, memlet)
+            edges.append(edge)
+            internal_edges[memlet.data].append(edge)
             tomemlet[memlet.data] = memlet
 
         # If there are no outputs, add empty memlet
@@ -1832,7 +2002,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             self.add_edge(tasklet, None, map_exit, None, mm.Memlet())
 
         if external_edges:
-            for out, outnode in sorted(outdict.items()):
+            for out, outnode in outdict.items():
                 # Add external edge
                 if propagate:
                     outer_memlet = propagate_memlet(self, tomemlet[out], map_exit, True)
@@ -1841,13 +2011,12 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
                 edges.append(self.add_edge(map_exit, "OUT_" + out, outnode, None, outer_memlet))
 
                 # Add connectors to internal edges
-                for e in self.in_edges(map_exit):
-                    if e.data.data == out:
-                        e._dst_conn = "IN_" + out
+                for e in internal_edges[out]:
+                    e._dst_conn = "IN_" + out
 
-                # Add connectors to map entry
-                map_exit.add_in_connector("IN_" + out)
-                map_exit.add_out_connector("OUT_" + out)
+            # Add connectors to map exit
+            map_exit.in_connectors = {**map_exit.in_connectors, **{"IN_" + out: None for out in outdict}}
+            map_exit.out_connectors = {**map_exit.out_connectors, **{"OUT_" + out: None for out in outdict}}
 
         # Try to initialize memlets
         for edge in edges:
@@ -1974,17 +2143,17 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
 
         # Autodetermine scope connector ID
         if scope_connector is None:
-            # Pick out numbered connectors that do not lead into the scope range
+            # Pick out numbered connectors that do not lead into the scope range (only the maximum matters, so the
+            # two connector dictionaries are scanned directly instead of building their union)
             conn_id = 1
-            for conn in (scope_node.in_connectors.keys() | scope_node.out_connectors.keys()):
-                if conn.startswith("IN_") or conn.startswith("OUT_"):
-                    conn_name = conn[conn.find("_") + 1:]
-                    try:
-                        cid = int(conn_name)
-                        if cid >= conn_id:
-                            conn_id = cid + 1
-                    except (TypeError, ValueError):
-                        pass
+            for connectors in (scope_node.in_connectors, scope_node.out_connectors):
+                for conn in connectors:
+                    if conn.startswith(("IN_", "OUT_")):
+                        conn_name = conn.partition("_")[2]
+                        if conn_name.isdecimal():
+                            cid = int(conn_name)
+                            if cid >= conn_id:
+                                conn_id = cid + 1
             scope_connector = str(conn_id)
 
         # Add connectors
@@ -2090,16 +2259,18 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
 
         path = edges if propagate_forward else reversed(edges)
         last_conn = None
+        last_edge = len(edges) - 1
         # Propagate and add edges
         for i, edge in enumerate(path):
-            # Figure out source and destination connectors
+            # Figure out source and destination connectors. The outermost edge connects to the given connectors, so
+            # no new scope connector is needed for it (which also covers paths with a single edge)
             if propagate_forward:
-                next_conn = edge.dst.next_connector(memlet.data)
+                next_conn = edge.dst.next_connector(memlet.data) if i < last_edge else None
                 sconn = src_conn if i == 0 else "OUT_" + last_conn
-                dconn = dst_conn if i == len(edges) - 1 else "IN_" + next_conn
+                dconn = dst_conn if i == last_edge else "IN_" + next_conn
             else:
-                next_conn = edge.src.next_connector(memlet.data)
-                sconn = src_conn if i == len(edges) - 1 else "OUT_" + next_conn
+                next_conn = edge.src.next_connector(memlet.data) if i < last_edge else None
+                sconn = src_conn if i == last_edge else "OUT_" + next_conn
                 dconn = dst_conn if i == 0 else "IN_" + last_conn
 
             last_conn = next_conn
@@ -2107,9 +2278,9 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             if cur_memlet.is_empty():
                 if propagate_forward:
                     sconn = src_conn if i == 0 else None
-                    dconn = dst_conn if i == len(edges) - 1 else None
+                    dconn = dst_conn if i == last_edge else None
                 else:
-                    sconn = src_conn if i == len(edges) - 1 else None
+                    sconn = src_conn if i == last_edge else None
                     dconn = dst_conn if i == 0 else None
 
             # Modify edge to match memlet path
@@ -2118,19 +2289,13 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             edge._data = cur_memlet
 
             # Add connectors to edges
-            if propagate_forward:
-                if dconn is not None:
-                    edge.dst.add_in_connector(dconn)
-                if sconn is not None:
-                    edge.src.add_out_connector(sconn)
-            else:
-                if dconn is not None:
-                    edge.dst.add_in_connector(dconn)
-                if sconn is not None:
-                    edge.src.add_out_connector(sconn)
+            if dconn is not None:
+                edge.dst.add_in_connector(dconn)
+            if sconn is not None:
+                edge.src.add_out_connector(sconn)
 
             # Propagate current memlet to produce the next one
-            if i < len(edges) - 1:
+            if i < last_edge:
                 snode = edge.dst if propagate_forward else edge.src
                 if not cur_memlet.is_empty():
                     if propagate:
@@ -2162,46 +2327,47 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             path = reversed(path)
 
         for edge in path:
+            src, dst = edge.src, edge.dst
 
             self.remove_edge(edge)
 
             # Check if there are any other edges exiting the source node that
             # use the same connector
-            for e in self.out_edges(edge.src):
+            for e in self.out_edges(src):
                 if e.src_conn is not None and e.src_conn == edge.src_conn:
                     other_outgoing = True
                     break
             else:
                 other_outgoing = False
-                edge.src.remove_out_connector(edge.src_conn)
+                src.remove_out_connector(edge.src_conn)
 
             # Check if there are any other edges entering the destination node
             # that use the same connector
-            for e in self.in_edges(edge.dst):
+            for e in self.in_edges(dst):
                 if e.dst_conn is not None and e.dst_conn == edge.dst_conn:
                     other_incoming = True
                     break
             else:
                 other_incoming = False
-                edge.dst.remove_in_connector(edge.dst_conn)
+                dst.remove_in_connector(edge.dst_conn)
 
-            if isinstance(edge.src, nd.EntryNode):
+            if isinstance(src, nd.EntryNode):
                 # If removing this edge orphans the entry node, replace the
                 # edge with an empty edge
                 # NOTE: The entry node is an orphan iff it has no other outgoing edges.
-                if self.out_degree(edge.src) == 0:
-                    self.add_nedge(edge.src, edge.dst, mm.Memlet())
+                if self.out_degree(src) == 0:
+                    self.add_nedge(src, dst, mm.Memlet())
                 if other_outgoing:
                     # If other inner memlets use the outer memlet, we have to
                     # stop the deletion here
                     break
 
-            if isinstance(edge.dst, nd.ExitNode):
+            if isinstance(dst, nd.ExitNode):
                 # If removing this edge orphans the exit node, replace the
                 # edge with an empty edge
                 # NOTE: The exit node is an orphan iff it has no other incoming edges.
-                if self.in_degree(edge.dst) == 0:
-                    self.add_nedge(edge.src, edge.dst, mm.Memlet())
+                if self.in_degree(dst) == 0:
+                    self.add_nedge(src, dst, mm.Memlet())
                 if other_incoming:
                     # If other inner memlets use the outer memlet, we have to
                     # stop the deletion here
@@ -2209,10 +2375,10 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
 
             # Prune access nodes
             if remove_orphans:
-                if (isinstance(edge.src, nd.AccessNode) and self.degree(edge.src) == 0):
-                    self.remove_node(edge.src)
-                if (isinstance(edge.dst, nd.AccessNode) and self.degree(edge.dst) == 0):
-                    self.remove_node(edge.dst)
+                if (isinstance(src, nd.AccessNode) and self.degree(src) == 0):
+                    self.remove_node(src)
+                if (isinstance(dst, nd.AccessNode) and self.degree(dst) == 0):
+                    self.remove_node(dst)
 
     # DEPRECATED FUNCTIONS
     ######################################
@@ -2234,20 +2400,19 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             'The "SDFGState.add_array" API is deprecated, please '
             'use "SDFG.add_array" and "SDFGState.add_access"', DeprecationWarning)
         # Workaround to allow this legacy API
-        if name in self.sdfg._arrays:
-            del self.sdfg._arrays[name]
-        self.sdfg.add_array(name,
-                            shape,
-                            dtype,
-                            storage=storage,
-                            transient=transient,
-                            strides=strides,
-                            offset=offset,
-                            lifetime=lifetime,
-                            debuginfo=debuginfo,
-                            find_new_name=find_new_name,
-                            total_size=total_size,
-                            alignment=alignment)
+        self.sdfg._arrays.pop(name, None)
+        name, _ = self.sdfg.add_array(name,
+                                      shape,
+                                      dtype,
+                                      storage=storage,
+                                      transient=transient,
+                                      strides=strides,
+                                      offset=offset,
+                                      lifetime=lifetime,
+                                      debuginfo=debuginfo,
+                                      find_new_name=find_new_name,
+                                      total_size=total_size,
+                                      alignment=alignment)
         return self.add_access(name, debuginfo)
 
     def add_stream(
@@ -2267,8 +2432,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             'The "SDFGState.add_stream" API is deprecated, please '
             'use "SDFG.add_stream" and "SDFGState.add_access"', DeprecationWarning)
         # Workaround to allow this legacy API
-        if name in self.sdfg._arrays:
-            del self.sdfg._arrays[name]
+        self.sdfg._arrays.pop(name, None)
         self.sdfg.add_stream(
             name,
             dtype,
@@ -2296,8 +2460,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
             'The "SDFGState.add_scalar" API is deprecated, please '
             'use "SDFG.add_scalar" and "SDFGState.add_access"', DeprecationWarning)
         # Workaround to allow this legacy API
-        if name in self.sdfg._arrays:
-            del self.sdfg._arrays[name]
+        self.sdfg._arrays.pop(name, None)
         self.sdfg.add_scalar(name, dtype, storage, transient, lifetime, debuginfo)
         return self.add_access(name, debuginfo)
 
@@ -2328,70 +2491,78 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], ControlFlowBlo
     def fill_scope_connectors(self):
         """ Creates new "IN_%d" and "OUT_%d" connectors on each scope entry
             and exit, depending on array names. """
-        for nid, node in enumerate(self.nodes()):
+        for node in self.nodes():
             ####################################################
             # Add connectors to scope entries
             if isinstance(node, nd.EntryNode):
+                in_edges = self.in_edges(node)
                 # Find current number of input connectors
-                num_inputs = len(
-                    [e for e in self.in_edges(node) if e.dst_conn is not None and e.dst_conn.startswith("IN_")])
+                num_inputs = sum(1 for e in in_edges if e.dst_conn is not None and e.dst_conn[:3] == "IN_")
 
                 conn_to_data = {}
+                new_in_connectors = []
+                new_out_connectors = []
 
                 # Append input connectors and get mapping of connectors to data
-                for edge in self.in_edges(node):
-                    if edge.data.data in conn_to_data:
+                for edge in in_edges:
+                    data = edge.data.data
+                    if data in conn_to_data:
                         raise NotImplementedError(
                             f"Cannot fill scope connectors in SDFGState {self.label} because EntryNode {node.label} "
-                            f"has multiple input edges from data {edge.data.data}.")
+                            f"has multiple input edges from data {data}.")
                     # We're only interested in edges without connectors
-                    if edge.dst_conn is not None or edge.data.data is None:
+                    if edge.dst_conn is not None or data is None:
                         continue
                     edge._dst_conn = "IN_" + str(num_inputs + 1)
-                    node.add_in_connector(edge.dst_conn)
-                    conn_to_data[edge.data.data] = num_inputs + 1
+                    new_in_connectors.append(edge.dst_conn)
+                    conn_to_data[data] = num_inputs + 1
 
                     num_inputs += 1
 
                 # Set the corresponding output connectors
                 for edge in self.out_edges(node):
-                    if edge.src_conn is not None:
-                        continue
-                    if edge.data.data is None:
+                    data = edge.data.data
+                    if edge.src_conn is not None or data is None:
                         continue
-                    edge._src_conn = "OUT_" + str(conn_to_data[edge.data.data])
-                    node.add_out_connector(edge.src_conn)
+                    edge._src_conn = "OUT_" + str(conn_to_data[data])
+                    new_out_connectors.append(edge.src_conn)
+
+                _add_new_connectors(node, new_in_connectors, new_out_connectors)
             ####################################################
             # Same treatment for scope exits
-            if isinstance(node, nd.ExitNode):
+            elif isinstance(node, nd.ExitNode):
+                out_edges = self.out_edges(node)
                 # Find current number of output connectors
-                num_outputs = len(
-                    [e for e in self.out_edges(node) if e.src_conn is not None and e.src_conn.startswith("OUT_")])
+                num_outputs = sum(1 for e in out_edges if e.src_conn is not None and e.src_conn[:4] == "OUT_")
 
                 conn_to_data = {}
+                new_in_connectors = []
+                new_out_connectors = []
 
                 # Append output connectors and get mapping of connectors to data
-                for edge in self.out_edges(node):
-                    if edge.src_conn is not None and edge.src_conn.startswith("OUT_"):
-                        conn_to_data[edge.data.data] = edge.src_conn[4:]
+                for edge in out_edges:
+                    data = edge.data.data
+                    if edge.src_conn is not None and edge.src_conn[:4] == "OUT_":
+                        conn_to_data[data] = edge.src_conn[4:]
 
                     # We're only interested in edges without connectors
-                    if edge.src_conn is not None or edge.data.data is None:
+                    if edge.src_conn is not None or data is None:
                         continue
                     edge._src_conn = "OUT_" + str(num_outputs + 1)
-                    node.add_out_connector(edge.src_conn)
-                    conn_to_data[edge.data.data] = num_outputs + 1
+                    new_out_connectors.append(edge.src_conn)
+                    conn_to_data[data] = num_outputs + 1
 
                     num_outputs += 1
 
                 # Set the corresponding input connectors
                 for edge in self.in_edges(node):
-                    if edge.dst_conn is not None:
-                        continue
-                    if edge.data.data is None:
+                    data = edge.data.data
+                    if edge.dst_conn is not None or data is None:
                         continue
-                    edge._dst_conn = "IN_" + str(conn_to_data[edge.data.data])
-                    node.add_in_connector(edge.dst_conn)
+                    edge._dst_conn = "IN_" + str(conn_to_data[data])
+                    new_in_connectors.append(edge.dst_conn)
+
+                _add_new_connectors(node, new_in_connectors, new_out_connectors)
 
 
 class ContinueBlock(ControlFlowBlock):
@@ -2437,9 +2608,14 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         ControlFlowBlock.__init__(self, label, sdfg)
 
         self._labels: Set[str] = set()
+        self._node_to_block_cache: Optional[Dict[Union[nd.Node, ControlFlowBlock], ControlFlowBlock]] = None
         self._start_block: Optional[int] = None
         self._cached_start_block: Optional[ControlFlowBlock] = None
+        # Blocks without incoming edges, kept up to date by add/remove_node and add/remove_edge
+        self._source_blocks: Set[ControlFlowBlock] = set()
+        self._block_order_cache: Optional[Tuple[ControlFlowBlock, List[ControlFlowBlock]]] = None
         self._cfg_list: List['ControlFlowRegion'] = [self]
+        self._cached_cfg_id: int = 0
 
     @property
     def root_sdfg(self) -> 'SDFG':
@@ -2476,9 +2652,12 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         """
         # TODO: Refactor
         sub_cfg_list = self._cfg_list
+        # Control flow regions compare by identity, so membership is tracked with a set of IDs instead of list scans
+        known_cfgs = set(map(id, sub_cfg_list))
         for g in cfg_list:
-            if g not in sub_cfg_list:
+            if id(g) not in known_cfgs:
                 sub_cfg_list.append(g)
+                known_cfgs.add(id(g))
         ptarget = None
         if isinstance(self, dace.SDFG) and self.parent_sdfg is not None:
             ptarget = self.parent_sdfg
@@ -2518,8 +2697,8 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
 
             # Add all region edges.
             for edge in self.edges():
-                src = block_to_state_map[edge.src] if edge.src in block_to_state_map else edge.src
-                dst = block_to_state_map[edge.dst] if edge.dst in block_to_state_map else edge.dst
+                src = block_to_state_map.get(edge.src, edge.src)
+                dst = block_to_state_map.get(edge.dst, edge.dst)
                 parent.add_edge(src, dst, edge.data)
 
             # Redirect all edges to the region to the internal start state.
@@ -2547,7 +2726,6 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
     def add_return(self, label=None) -> ReturnBlock:
         label = self._ensure_unique_block_name(label)
         block = ReturnBlock(label)
-        self._labels.add(label)
         self.add_node(block)
         return block
 
@@ -2566,7 +2744,24 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
             raise TypeError('Expected InterstateEdge, got ' + str(type(data)))
         if dst is self._cached_start_block:
             self._cached_start_block = None
-        return super().add_edge(src, dst, data)
+        self._block_order_cache = None
+        edge = super().add_edge(src, dst, data)
+        self._source_blocks.discard(dst)
+        return edge
+
+    def remove_edge(self, edge: Edge['dace.sdfg.InterstateEdge']):
+        self._block_order_cache = None
+        super().remove_edge(edge)
+        if edge.dst in self._nodes and self.in_degree(edge.dst) == 0:
+            self._source_blocks.add(edge.dst)
+
+    def _ordered_blocks(self) -> List[ControlFlowBlock]:
+        """ Returns the blocks reachable from the start block in topological order. The order is cached until the
+            graph structure or the start block changes. """
+        start_block = self.start_block
+        if self._block_order_cache is None or self._block_order_cache[0] is not start_block:
+            self._block_order_cache = (start_block, list(self.topological_sort(start_block)))
+        return self._block_order_cache[1]
 
     def _ensure_unique_block_name(self, proposed: Optional[str] = None) -> str:
         if self._labels is None or len(self._labels) != self.number_of_nodes():
@@ -2586,7 +2781,11 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
             node.label = self._ensure_unique_block_name(node.label)
 
         super().add_node(node)
+        self._source_blocks.add(node)
+        if self._labels is not None:
+            self._labels.add(node.label)
         self._cached_start_block = None
+        self._block_order_cache = None
         node.parent_graph = self
         if isinstance(self, dace.SDFG):
             node.sdfg = self
@@ -2601,10 +2800,16 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
             self.start_block = len(self.nodes()) - 1
             self._cached_start_block = node
 
+    def remove_node(self, node: ControlFlowBlock):
+        if self._labels is not None:
+            self._labels.discard(node.label)
+        self._block_order_cache = None
+        super().remove_node(node)
+        self._source_blocks.discard(node)
+
     def add_state(self, label=None, is_start_block=False, *, is_start_state: bool = None) -> SDFGState:
         label = self._ensure_unique_block_name(label)
         state = SDFGState(label)
-        self._labels.add(label)
         start_block = is_start_block
         if is_start_state is not None:
             warnings.warn('is_start_state is deprecated, use is_start_block instead', DeprecationWarning)
@@ -2675,7 +2880,7 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         used_before_assignment = set() if used_before_assignment is None else used_before_assignment
 
         try:
-            ordered_blocks = self.topological_sort(self.start_block)
+            ordered_blocks = self._ordered_blocks()
         except ValueError:  # Failsafe (e.g., for invalid or empty SDFGs)
             ordered_blocks = self.nodes()
 
@@ -2698,10 +2903,11 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
                 # compute the symbols that are used before being assigned.
                 efsyms = e.data.used_symbols(all_symbols)
                 # collect symbols representing data containers
-                dsyms = {sym for sym in efsyms if sym in self.sdfg.arrays}
+                arrays = self.sdfg.arrays
+                dsyms = [sym for sym in efsyms if sym in arrays]
                 for d in dsyms:
-                    efsyms |= {str(sym) for sym in self.sdfg.arrays[d].used_symbols(all_symbols)}
-                defined_syms |= set(e.data.assignments.keys()) - (efsyms | state_symbols)
+                    efsyms.update(map(str, arrays[d].used_symbols(all_symbols)))
+                defined_syms.update(k for k in e.data.assignments if k not in efsyms and k not in state_symbols)
                 used_before_assignment.update(efsyms - defined_syms)
                 free_syms |= efsyms
 
@@ -2711,12 +2917,12 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         if isinstance(self, dace.SDFG):
             # Remove from defined symbols those that are in the symbol mapping
             if self.parent_nsdfg_node is not None and keep_defined_in_mapping:
-                defined_syms -= set(self.parent_nsdfg_node.symbol_mapping.keys())
+                defined_syms.difference_update(self.parent_nsdfg_node.symbol_mapping.keys())
 
             # Add the set of SDFG symbol parameters
             # If all_symbols is False, those symbols would only be added in the case of non-Python tasklets
             if all_symbols:
-                free_syms |= set(self.symbols.keys())
+                free_syms.update(self.symbols.keys())
 
         # Subtract symbols defined in inter-state edges and constants from the list of free symbols.
         free_syms -= defined_syms
@@ -2748,11 +2954,12 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
 
         dace.serialize.set_properties_from_json(ret, json_obj)
 
+        # States only read from the context, so a single copy is shared by all of them
+        nci = copy.copy(context_info)
+        nci['parent_graph'] = ret
+
         nodelist = []
         for n in nodes:
-            nci = copy.copy(context_info)
-            nci['parent_graph'] = ret
-
             state = SDFGState.from_json(n, context=nci)
             ret.add_node(state)
             nodelist.append(state)
@@ -2771,14 +2978,26 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
 
     def all_control_flow_regions(self, recursive=False) -> Iterator['ControlFlowRegion']:
         """ Iterate over this and all nested control flow regions. """
+        # Pre-order traversal with an explicit stack of iterators, rather than chaining one generator per nesting level
         yield self
-        for block in self.nodes():
-            if isinstance(block, SDFGState) and recursive:
-                for node in block.nodes():
-                    if isinstance(node, nd.NestedSDFG):
-                        yield from node.sdfg.all_control_flow_regions(recursive=recursive)
-            elif isinstance(block, ControlFlowRegion):
-                yield from block.all_control_flow_regions(recursive=recursive)
+        stack = [iter(self.nodes())]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, SDFGState):
+                    if recursive:
+                        # Descend into the state to find nested SDFGs
+                        stack.append(iter(child.nodes()))
+                        break
+                elif isinstance(child, ControlFlowRegion):
+                    yield child
+                    stack.append(iter(child.nodes()))
+                    break
+                elif isinstance(child, nd.NestedSDFG):
+                    yield child.sdfg
+                    stack.append(iter(child.sdfg.nodes()))
+                    break
+            else:
+                stack.pop()
 
     def all_sdfgs_recursive(self) -> Iterator['SDFG']:
         """ Iterate over this and all nested SDFGs. """
@@ -2788,11 +3007,16 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
 
     def all_states(self) -> Iterator[SDFGState]:
         """ Iterate over all states in this control flow graph. """
-        for block in self.nodes():
-            if isinstance(block, SDFGState):
-                yield block
-            elif isinstance(block, ControlFlowRegion):
-                yield from block.all_states()
+        stack = [iter(self.nodes())]
+        while stack:
+            for block in stack[-1]:
+                if isinstance(block, SDFGState):
+                    yield block
+                elif isinstance(block, ControlFlowRegion):
+                    stack.append(iter(block.nodes()))
+                    break
+            else:
+                stack.pop()
 
     def all_control_flow_blocks(self, recursive=False) -> Iterator[ControlFlowBlock]:
         """ Iterate over all control flow blocks in this control flow graph. """
@@ -2825,7 +3049,14 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         Returns the unique index of the current CFG within the current tree of CFGs (Top-level CFG/SDFG is 0, nested
         CFGs/SDFGs are greater).
         """
-        return self.cfg_list.index(self)
+        # The CFG list is replaced or extended when the tree changes, so the cached index is only trusted if it still
+        # points to this CFG
+        cfg_list = self.cfg_list
+        cfg_id = self._cached_cfg_id
+        if cfg_id >= len(cfg_list) or cfg_list[cfg_id] is not self:
+            cfg_id = cfg_list.index(self)
+            self._cached_cfg_id = cfg_id
+        return cfg_id
 
     @property
     def start_block(self):
@@ -2833,10 +3064,9 @@ class ControlFlowRegion(OrderedDiGraph[ControlFlowBlock, 'dace.sdfg.InterstateEd
         if self._cached_start_block is not None:
             return self._cached_start_block
 
-        source_nodes = self.source_nodes()
-        if len(source_nodes) == 1:
-            self._cached_start_block = source_nodes[0]
-            return source_nodes[0]
+        if len(self._source_blocks) == 1:
+            self._cached_start_block = next(iter(self._source_blocks))
+            return self._cached_start_block
         # If the starting block is ambiguous allow manual override.
         if self._start_block is not None:
             self._cached_start_block = self.node(self._start_block)
@@ -2986,8 +3216,8 @@ class LoopRegion(ControlFlowRegion):
 
         # Add all internal loop edges.
         for edge in self.edges():
-            src = block_to_state_map[edge.src] if edge.src in block_to_state_map else edge.src
-            dst = block_to_state_map[edge.dst] if edge.dst in block_to_state_map else edge.dst
+            src = block_to_state_map.get(edge.src, edge.src)
+            dst = block_to_state_map.get(edge.dst, edge.dst)
             parent.add_edge(src, dst, edge.data)
 
         # Redirect all edges to the loop to the init state.
@@ -3002,10 +3232,10 @@ class LoopRegion(ControlFlowRegion):
         # Add an initialization edge that initializes the loop variable if applicable.
         init_edge = dace.InterstateEdge()
         if self.init_statement is not None:
-            init_edge.assignments = {}
-            for stmt in self.init_statement.code:
-                assign: astutils.ast.Assign = stmt
-                init_edge.assignments[assign.targets[0].id] = astutils.unparse(assign.value)
+            init_edge.assignments = {
+                assign.targets[0].id: astutils.unparse(assign.value)
+                for assign in self.init_statement.code
+            }
         if self.inverted:
             parent.add_edge(init_state, self.start_block, init_edge)
         else:
@@ -3014,10 +3244,10 @@ class LoopRegion(ControlFlowRegion):
         # Connect the loop tail.
         update_edge = dace.InterstateEdge()
         if self.update_statement is not None:
-            update_edge.assignments = {}
-            for stmt in self.update_statement.code:
-                assign: astutils.ast.Assign = stmt
-                update_edge.assignments[assign.targets[0].id] = astutils.unparse(assign.value)
+            update_edge.assignments = {
+                assign.targets[0].id: astutils.unparse(assign.value)
+                for assign in self.update_statement.code
+            }
         parent.add_edge(loop_latch_state, guard_state, update_edge)
 
         # Add condition checking edges and connect the guard state.
@@ -3088,14 +3318,12 @@ class LoopRegion(ControlFlowRegion):
     def add_break(self, label=None) -> BreakBlock:
         label = self._ensure_unique_block_name(label)
         block = BreakBlock(label)
-        self._labels.add(label)
         self.add_node(block)
         return block
 
     def add_continue(self, label=None) -> ContinueBlock:
         label = self._ensure_unique_block_name(label)
         block = ContinueBlock(label)
-        self._labels.add(label)
         self.add_node(block)
         return block
 
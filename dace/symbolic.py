@@ -23,6 +23,13 @@ _NAME_TOKENS = re.compile(r'[a-zA-Z_][a-zA-Z_0-9]*')
 _sympy_clash = {k: v if v else getattr(sympy.abc, k) for k, v in sympy.abc._clash.items()}
 
 
+@lru_cache(maxsize=2048)
+def _is_integer_typeclass(dtype: dtypes.typeclass) -> bool:
+    """ Returns True if the given typeclass matches a Python or NumPy integer type. """
+    dkeys = [k for k, v in dtypes.dtype_to_typeclass().items() if v == dtype]
+    return any(issubclass(k, int) or issubclass(k, numpy.integer) for k in dkeys)
+
+
 class symbol(sympy.Symbol):
     """ Defines a symbolic expression. Extends SymPy symbols with DaCe-related
         information. """
@@ -42,9 +49,7 @@ class symbol(sympy.Symbol):
         if not isinstance(dtype, dtypes.typeclass):
             raise TypeError('dtype must be a DaCe type, got %s' % str(dtype))
 
-        dkeys = [k for k, v in dtypes.dtype_to_typeclass().items() if v == dtype]
-        is_integer = [issubclass(k, int) or issubclass(k, numpy.integer) for k in dkeys]
-        if 'integer' in assumptions or not numpy.any(is_integer):
+        if 'integer' in assumptions or not _is_integer_typeclass(dtype):
             # Using __xnew__ as the regular __new__ is cached, which leads
             # to modifying different references of symbols with the same name.
             self = sympy.Symbol.__xnew__(cls, name, **assumptions)
@@ -1407,7 +1412,7 @@ def symbols_in_code(code: str, potential_symbols: Set[str] = None, symbols_to_ig
         # Don't bother tokenizing for an empty set of potential symbols
         return set()
 
-    tokens = set(re.findall(_NAME_TOKENS, code))
+    tokens = set(_NAME_TOKENS.findall(code))
     if potential_symbols is not None:
         tokens &= potential_symbols
     if symbols_to_ignore is None:
@@ -28,18 +28,22 @@ class MapDimShuffle(transformation.SingleStateTransformation):
 
     def can_be_applied(self, graph, expr_index, sdfg, permissive=False):
         map_entry: nodes.MapEntry = self.map_entry
-        if self.parameters is None:
+        parameters = self.parameters
+        if parameters is None:
             return False
-        if len(self.parameters) != len(map_entry.map.params):
+        params = map_entry.map.params
+        if len(parameters) != len(params):
             return False
-        if set(self.parameters) != set(map_entry.map.params):
+        if sorted(parameters) != sorted(params):
             return False
         return True
 
     def apply(self, graph: SDFGState, sdfg: SDFG):
         map_entry: nodes.MapEntry = self.map_entry
-        new_map_order: list[int] = [map_entry.map.params.index(param) for param in self.parameters]
+        param_index = {param: i for i, param in enumerate(map_entry.map.params)}
+        new_map_order: list[int] = [param_index[param] for param in self.parameters]
 
-        map_entry.range.ranges = [map_entry.range.ranges[new_pos] for new_pos in new_map_order]
-        map_entry.range.tile_sizes = [map_entry.range.tile_sizes[new_pos] for new_pos in new_map_order]
+        map_range = map_entry.range
+        map_range.ranges = [map_range.ranges[new_pos] for new_pos in new_map_order]
+        map_range.tile_sizes = [map_range.tile_sizes[new_pos] for new_pos in new_map_order]
         map_entry.map.params = [map_entry.map.params[new_pos] for new_pos in new_map_order]
@@ -182,7 +182,7 @@ class MapExpansion(pm.SingleStateTransformation):
 
         from dace.sdfg.scope import ScopeTree
         scope = None
-        queue: List[ScopeTree] = graph.scope_leaves()
+        queue: List[ScopeTree] = graph.scope_leaves(copy=True)
         while len(queue) > 0:
             tnode = queue.pop()
             if tnode.entry == entries[-1]:
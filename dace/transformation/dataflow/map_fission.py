@@ -417,7 +417,7 @@ class MapFission(transformation.SingleStateTransformation):
 
                 # NOTE: In the following scope dictionary, we mark the new MapEntries as existing in their own scope.
                 # This makes it easier to detect edges that are outside the new Map scopes (after MapFission).
-                scope_dict = state.scope_dict()
+                scope_dict = dict(state.scope_dict())
                 for k, v in scope_dict.items():
                     if isinstance(k, nodes.MapEntry) and k in new_map_entries and v is None:
                         scope_dict[k] = k
@@ -351,6 +351,48 @@ def test_fortran_frontend_any_array_comparison_2d_subset_offset():
     sdfg(first=first, second=second, res=res)
     assert list(res) == [0, 1]
 
+def test_fortran_frontend_any_sum_result():
+    test_string = """
+                    PROGRAM intrinsic_any_test
+                    implicit none
+                    integer, dimension(5) :: first
+                    integer, dimension(3) :: sums
+                    logical, dimension(2) :: res
+                    CALL intrinsic_any_test_function(first, sums, res)
+                    end
+
+                    SUBROUTINE intrinsic_any_test_function(first, sums, res)
+                    integer, dimension(5) :: first
+                    integer, dimension(3) :: sums
+                    logical, dimension(2) :: res
+
+                    sums(1) = SUM(first)
+                    sums(2) = SUM(first(1:2))
+                    sums(3) = SUM(first(3:5))
+                    res(1) = ANY(sums .eq. 5)
+                    res(2) = ANY(sums(2:3) .eq. 0)
+
+                    END SUBROUTINE intrinsic_any_test_function
+                    """
+
+    sdfg = fortran_parser.create_sdfg_from_string(test_string, "intrinsic_any_test", False)
+    sdfg.simplify(verbose=True)
+    sdfg.compile()
+
+    size = 5
+    first = np.full([size], 1, order="F", dtype=np.int32)
+    sums = np.full([3], 0, order="F", dtype=np.int32)
+    res = np.full([2], 0, order="F", dtype=np.int32)
+
+    sdfg(first=first, sums=sums, res=res)
+    assert list(sums) == [5, 2, 3]
+    assert list(res) == [1, 0]
+
+    first[:] = [1, -1, 2, 2, 2]
+    sdfg(first=first, sums=sums, res=res)
+    assert list(sums) == [6, 0, 6]
+    assert list(res) == [0, 1]
+
 if __name__ == "__main__":
 
     test_fortran_frontend_any_array()
@@ -362,3 +404,4 @@ if __name__ == "__main__":
     test_fortran_frontend_any_array_comparison_2d()
     test_fortran_frontend_any_array_comparison_2d_subset()
     test_fortran_frontend_any_array_comparison_2d_subset_offset()
+    test_fortran_frontend_any_sum_result()
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from dace.frontend.fortran import ast_transforms, fortran_parser
+from dace.frontend.fortran import ast_transforms, fortran_parser, intrinsics
 
 def test_fortran_frontend_sum2loop_1d_without_offset():
     """
@@ -168,9 +168,133 @@ def test_fortran_frontend_arr2loop_2d_offset():
     assert res[1] == 190
     assert res[2] == 57
 
+def test_fortran_frontend_sum2loop_fused():
+    """
+    Tests that multiple sums in a single statement are computed correctly when they share the loop nest.
+    """
+    test_string = """
+                    PROGRAM index_offset_test
+                    implicit none
+                    double precision, dimension(5,4) :: d
+                    double precision, dimension(5,4) :: e
+                    double precision, dimension(2) :: res
+                    CALL index_test_function(d, e, res)
+                    end
+
+                    SUBROUTINE index_test_function(d, e, res)
+                    double precision, dimension(5,4) :: d
+                    double precision, dimension(5,4) :: e
+                    double precision, dimension(2) :: res
+
+                    res(1) = SUM(d) + SUM(e)
+                    res(2) = SUM(d(:, 2:3)) + SUM(e)
+
+                    END SUBROUTINE index_test_function
+                    """
+
+    sdfg = fortran_parser.create_sdfg_from_string(test_string, "index_offset_test", True)
+    sdfg.simplify(verbose=True)
+    sdfg.compile()
+
+    sizes = [5, 4]
+    d = np.full(sizes, 42, order="F", dtype=np.float64)
+    e = np.full(sizes, 42, order="F", dtype=np.float64)
+    cnt = 0
+    for i in range(sizes[0]):
+        for j in range(sizes[1]):
+            d[i, j] = cnt
+            e[i, j] = 2 * cnt
+            cnt += 1
+    res = np.full([2], 42, order="F", dtype=np.float64)
+    sdfg(d=d, e=e, res=res)
+    assert res[0] == 190 + 380
+    assert res[1] == np.sum(d[:, 1:3]) + 380
+
+def test_fortran_frontend_sum2loop_chunked():
+    """
+    Tests that the strip-mined lowering with partial results produces the same sums, including the remainder.
+    """
+    test_string = """
+                    PROGRAM index_offset_test
+                    implicit none
+                    double precision, dimension(11) :: d
+                    double precision, dimension(2:6,3) :: e
+                    double precision, dimension(3) :: res
+                    CALL index_test_function(d, e, res)
+                    end
+
+                    SUBROUTINE index_test_function(d, e, res)
+                    double precision, dimension(11) :: d
+                    double precision, dimension(2:6,3) :: e
+                    double precision, dimension(3) :: res
+
+                    res(1) = SUM(d)
+                    res(2) = SUM(d(2:9))
+                    res(3) = SUM(e)
+
+                    END SUBROUTINE index_test_function
+                    """
+
+    options = intrinsics.LoopLoweringOptions(chunk_size=2)
+    sdfg = fortran_parser.create_sdfg_from_string(test_string, "index_offset_test", True, intrinsic_options=options)
+    sdfg.simplify(verbose=True)
+    sdfg.compile()
+
+    d = np.full([11], 0, order="F", dtype=np.float64)
+    for i in range(11):
+        d[i] = i + 1
+    e = np.full([5, 3], 0, order="F", dtype=np.float64)
+    for i in range(5):
+        for j in range(3):
+            e[i, j] = i * 3 + j
+    res = np.full([3], 42, order="F", dtype=np.float64)
+    sdfg(d=d, e=e, res=res)
+    assert res[0] == 66
+    assert res[1] == 44
+    assert res[2] == np.sum(e)
+
+def test_fortran_frontend_sum2loop_unrolled():
+    """
+    Tests that sums over dimensions with small static extents are correct when the innermost loop is unrolled.
+    """
+    test_string = """
+                    PROGRAM index_offset_test
+                    implicit none
+                    double precision, dimension(2:5,3) :: d
+                    double precision, dimension(2) :: res
+                    CALL index_test_function(d, res)
+                    end
+
+                    SUBROUTINE index_test_function(d, res)
+                    double precision, dimension(2:5,3) :: d
+                    double precision, dimension(2) :: res
+
+                    res(1) = SUM(d)
+                    res(2) = SUM(d(3:4, 2:3))
+
+                    END SUBROUTINE index_test_function
+                    """
+
+    options = intrinsics.LoopLoweringOptions(unroll_threshold=4)
+    sdfg = fortran_parser.create_sdfg_from_string(test_string, "index_offset_test", True, intrinsic_options=options)
+    sdfg.simplify(verbose=True)
+    sdfg.compile()
+
+    d = np.full([4, 3], 0, order="F", dtype=np.float64)
+    for i in range(4):
+        for j in range(3):
+            d[i, j] = i * 3 + j
+    res = np.full([2], 42, order="F", dtype=np.float64)
+    sdfg(d=d, res=res)
+    assert res[0] == np.sum(d)
+    assert res[1] == np.sum(d[1:3, 1:3])
+
 if __name__ == "__main__":
 
     test_fortran_frontend_sum2loop_1d_without_offset()
     test_fortran_frontend_sum2loop_1d_offset()
     test_fortran_frontend_arr2loop_2d()
     test_fortran_frontend_arr2loop_2d_offset()
+    test_fortran_frontend_sum2loop_fused()
+    test_fortran_frontend_sum2loop_chunked()
+    test_fortran_frontend_sum2loop_unrolled()
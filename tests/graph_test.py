@@ -1,6 +1,9 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import unittest
+import networkx as nx
+import dace
 from dace.sdfg.graph import *
+from dace.sdfg.state import LoopRegion
 
 
 class TestOrderedGraphs(unittest.TestCase):
@@ -105,6 +108,29 @@ class TestOrderedGraphs(unittest.TestCase):
         self.assertEqual(next(bfs_edges), e3)
         self.assertEqual(next(bfs_edges), e6)
         self.assertEqual(next(bfs_edges), e7)
+
+    def test_degree_of_node_outside_graph(self):
+        # Validation queries the degree of states in nested regions through the top-level SDFG
+        sdfg = dace.SDFG('degree_outside_graph')
+        start = sdfg.add_state('start')
+        loop = LoopRegion('loop', 'i < 3', 'i', 'i = 0', 'i = i + 1')
+        sdfg.add_node(loop)
+        sdfg.add_edge(start, loop, dace.InterstateEdge())
+        inner = loop.add_state('inner', is_start_block=True)
+        self.assertEqual(sdfg.out_degree(start), 1)
+        self.assertEqual(sdfg.in_degree(loop), 1)
+        self.assertEqual(list(sdfg.in_degree(inner)), [])
+        self.assertEqual(list(sdfg.out_degree(inner)), [])
+        sdfg.validate()
+
+        g = OrderedDiGraph()
+        g.add_node(0)
+        self.assertEqual(g.in_degree(0), 0)
+        # Nodes that are not in the graph behave as in networkx
+        with self.assertRaises(nx.NetworkXError):
+            g.in_degree(1)
+        with self.assertRaises(nx.NetworkXError):
+            g.out_degree(1)
     
     def test_dfs_edges(self):
 
@@ -115,6 +141,21 @@ class TestOrderedGraphs(unittest.TestCase):
         assert len(visited_edges) == len(set(visited_edges))
         assert all(e in visited_edges for e in sdfg.edges())
 
+    def test_subgraph_view(self):
+        g = OrderedDiGraph()
+        g.add_edge(0, 7, "abc")
+        g.add_edge(7, 3, "def")
+        g.add_edge(3, 5, "ghi")
+        sub = SubgraphView(g, [5, 0, 7])
+        self.assertEqual(list(sub.nodes()), [0, 7, 5])
+        self.assertEqual([e.data for e in sub.edges()], ["abc"])
+        self.assertEqual(sub.in_degree(5), 0)
+        self.assertEqual(sub.out_degree(0), 1)
+        with self.assertRaises(NodeNotFoundError):
+            sub.in_edges(3)
+        with self.assertRaises(NodeNotFoundError):
+            SubgraphView(g, [0, 42])
+
 
 if __name__ == "__main__":
     unittest.main()
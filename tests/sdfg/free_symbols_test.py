@@ -129,6 +129,37 @@ def test_nested_sdfg_free_symbols():
     assert 'k' not in inner_sdfg.free_symbols
 
 
+def test_callback_symbols():
+    sdfg = dace.SDFG('callback_symbols')
+    sdfg.add_symbol('cb', dace.callback(None))
+    sdfg.add_symbol('other', dace.callback(None))
+    state = sdfg.add_state('state')
+    tasklet = state.add_tasklet('call', {}, {}, 'cb()')
+    assert state.free_symbols == {'cb'}
+    assert state.free_symbols == {'cb'}
+
+    # Renaming the callback in place must be reflected in the (cached) symbols of the tasklet
+    state.replace('cb', 'other')
+    assert tasklet.code.as_string.strip() == 'other()'
+    assert state.free_symbols == {'other'}
+
+
+def test_free_symbols_after_structure_change():
+    sdfg = dace.SDFG('free_symbols_after_structure_change')
+    s0 = sdfg.add_state('s0')
+    s1 = sdfg.add_state('s1')
+    sdfg.add_edge(s0, s1, dace.InterstateEdge(assignments={'i': 'N'}))
+    assert sdfg.free_symbols == {'N'}
+
+    s2 = sdfg.add_state('s2')
+    e = sdfg.add_edge(s1, s2, dace.InterstateEdge(assignments={'j': 'M + i'}))
+    assert sdfg.free_symbols == {'N', 'M'}
+
+    sdfg.remove_edge(e)
+    sdfg.add_edge(s1, s2, dace.InterstateEdge(assignments={'j': 'K'}))
+    assert sdfg.free_symbols == {'N', 'K'}
+
+
 if __name__ == '__main__':
     test_single_state()
     test_state_subgraph()
@@ -136,3 +167,5 @@ if __name__ == '__main__':
     test_constants()
     test_interstate_edge_symbols()
     test_nested_sdfg_free_symbols()
+    test_callback_symbols()
+    test_free_symbols_after_structure_change()
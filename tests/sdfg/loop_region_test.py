@@ -1,7 +1,7 @@
 # Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
 import numpy as np
-from dace.sdfg.state import LoopRegion
+from dace.sdfg.state import ControlFlowRegion, LoopRegion
 
 
 def test_loop_regular_for():
@@ -164,9 +164,26 @@ def test_triple_nested_for():
     assert np.allclose(C_validation, C_test)
 
 
+def test_continue_in_nested_loop():
+    sdfg = dace.SDFG('nested_continue')
+    outer = LoopRegion('outer', 'i < 10', 'i', 'i = 0', 'i = i + 1')
+    sdfg.add_node(outer, is_start_block=True)
+    region = ControlFlowRegion('region', sdfg)
+    outer.add_node(region, is_start_block=True)
+    inner = LoopRegion('inner', 'j < 10', 'j', 'j = 0', 'j = j + 1')
+    region.add_node(inner, is_start_block=True)
+    inner.add_continue()
+
+    # The continue belongs to the inner loop, also when it is reached through a nested region
+    assert inner.has_continue
+    assert not outer.has_continue
+    assert not any(n is inner.nodes()[0] for n, _ in outer.all_nodes_recursive(lambda n, _: n is not inner))
+
+
 if __name__ == '__main__':
     test_loop_regular_for()
     test_loop_regular_while()
     test_loop_do_while()
     test_loop_do_for()
     test_triple_nested_for()
+    test_continue_in_nested_loop()
@@ -14,5 +14,41 @@ def test_is_start_state_deprecation():
         sdfg2.add_node(state, is_start_state=True)
 
 
+def test_cfg_id_after_tree_change():
+    sdfg = dace.SDFG('cfg_id_test')
+    sdfg.add_state('start', is_start_block=True)
+    region_a = dace.sdfg.state.ControlFlowRegion('region_a')
+    region_b = dace.sdfg.state.ControlFlowRegion('region_b')
+    sdfg.add_node(region_a)
+    sdfg.add_node(region_b)
+    sdfg.reset_cfg_list()
+    assert sdfg.cfg_id == 0
+    assert region_a.cfg_id == 1
+    assert region_b.cfg_id == 2
+
+    sdfg.remove_node(region_a)
+    sdfg.reset_cfg_list()
+    assert region_b.cfg_id == 1
+    assert sdfg.cfg_list[region_b.cfg_id] is region_b
+
+
+def test_start_block_after_edge_changes():
+    sdfg = dace.SDFG('start_block_test')
+    s0 = sdfg.add_state('s0')
+    s1 = sdfg.add_state('s1')
+    e = sdfg.add_edge(s0, s1, dace.InterstateEdge())
+    assert sdfg.start_block is s0
+
+    # Reversing the only edge makes the other block the unique source
+    sdfg.remove_edge(e)
+    sdfg.add_edge(s1, s0, dace.InterstateEdge())
+    assert sdfg.start_block is s1
+
+    sdfg.remove_node(s1)
+    assert sdfg.start_block is s0
+
+
 if __name__ == '__main__':
     test_is_start_state_deprecation()
+    test_cfg_id_after_tree_change()
+    test_start_block_after_edge_changes()
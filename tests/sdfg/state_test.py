@@ -43,6 +43,16 @@ def test_read_write_set_y_formation():
 
     assert 'B' not in state.read_and_write_sets()[0]
 
+def test_read_write_set_constant_cover():
+    from dace.sdfg.state import _covers
+    from dace.subsets import Range
+
+    for cover, other in [('0:10', '2:5'), ('2:5', '0:10'), ('0:10, 0:N', '0:5, 0:N'), ('0:5, 0:N', '6:8, 0:N'),
+                         ('0:N', '0:M'), ('3', '3'), ('3', '4')]:
+        cover, other = Range.from_string(cover), Range.from_string(other)
+        assert _covers(cover, other) == cover.covers(other)
+
+
 def test_deepcopy_state():
     N = dace.symbol('N')
 
@@ -58,7 +68,108 @@ def test_deepcopy_state():
     sdfg.validate()
 
 
+def test_memlet_tree_nested_maps():
+    sdfg = dace.SDFG('memlet_tree_nested_maps')
+    sdfg.add_array('A', [1], dace.float64)
+    sdfg.add_array('B', [1], dace.float64)
+    state = sdfg.add_state('state')
+    read_a = state.add_access('A')
+    write_b = state.add_access('B')
+    entries, exits = [], []
+    for i in range(20):
+        me, mx = state.add_map(f'map{i}', {f'i{i}': '0:1'})
+        entries.append(me)
+        exits.append(mx)
+    task = state.add_tasklet('work', {'a'}, {'b'}, 'b = a')
+    state.add_memlet_path(read_a, *entries, task, dst_conn='a', memlet=dace.Memlet('A[0]'))
+    state.add_memlet_path(task, *reversed(exits), write_b, src_conn='b', memlet=dace.Memlet('B[0]'))
+
+    for edge in state.edges():
+        tree = state.memlet_tree(edge)
+        assert tree.edge is edge
+        root = tree.root()
+        assert root.edge.src is read_a or root.edge.dst is write_b
+        assert len(list(root.traverse_children(include_self=True))) == 21
+
+
+def test_memlet_path_renamed_connectors():
+    sdfg = dace.SDFG('memlet_path_renamed_connectors')
+    sdfg.add_array('A', [1], dace.float64)
+    sdfg.add_array('B', [1], dace.float64)
+    state = sdfg.add_state('state')
+    read_a = state.add_access('A')
+    write_b = state.add_access('B')
+    me, mx = state.add_map('map', {'i': '0:1'})
+    task = state.add_tasklet('work', {'a'}, {'b'}, 'b = a')
+    state.add_memlet_path(read_a, me, task, dst_conn='a', memlet=dace.Memlet('A[0]'))
+    state.add_memlet_path(task, mx, write_b, src_conn='b', memlet=dace.Memlet('B[0]'))
+    inner = state.in_edges(task)[0]
+    assert len(state.memlet_path(inner)) == 2
+
+    # Rename the scope connectors in place, without modifying the graph structure
+    outer = state.in_edges(me)[0]
+    me.remove_in_connector(outer.dst_conn)
+    me.remove_out_connector(inner.src_conn)
+    me.add_in_connector('IN_renamed')
+    me.add_out_connector('OUT_renamed')
+    outer.dst_conn = 'IN_renamed'
+    inner.src_conn = 'OUT_renamed'
+    assert state.memlet_path(inner) == [outer, inner]
+
+
+def test_block_lookup_after_moving_nodes():
+    sdfg = dace.SDFG('block_lookup')
+    sdfg.add_array('A', [10], dace.float64)
+    sdfg.add_array('B', [10], dace.float64)
+    s1 = sdfg.add_state('s1')
+    s2 = sdfg.add_state_after(s1, 's2')
+    s1.add_mapped_tasklet('copy',
+                          dict(i='0:10'),
+                          dict(a=dace.Memlet('A[i]')),
+                          'b = a',
+                          dict(b=dace.Memlet('B[i]')),
+                          external_edges=True)
+    me = next(n for n in s1.nodes() if isinstance(n, dace.nodes.MapEntry))
+    mx = s1.exit_node(me)
+    assert sdfg.exit_node(me) is mx
+    edge = s1.out_edges(me)[0]
+    assert sdfg.memlet_path(edge) == s1.memlet_path(edge)
+
+    # Move the whole subgraph to another state, after the lookups above were made
+    nodes = s1.nodes()
+    edges = s1.edges()
+    for n in nodes:
+        s2.add_node(n)
+    for e in edges:
+        s2.add_edge(e.src, e.src_conn, e.dst, e.dst_conn, e.data)
+    for n in nodes:
+        s1.remove_node(n)
+    edge = s2.out_edges(me)[0]
+    assert sdfg.exit_node(me) is mx
+    assert sdfg.entry_node(edge.dst) is me
+    assert sdfg.memlet_path(edge) == s2.memlet_path(edge)
+    assert len(list(sdfg.in_edges_by_connector(me, 'IN_A'))) == 1
+
+    s2.remove_node(me)
+    assert sdfg.exit_node(me) is None
+
+
+def test_unique_block_name_after_rename():
+    sdfg = dace.SDFG('unique_block_name_after_rename')
+    s0 = sdfg.add_state('s0')
+    s1 = sdfg.add_state('s1')
+    s1.label = 'renamed'
+    assert sdfg.add_state('renamed').label != 'renamed'
+    sdfg.remove_node(s0)
+    assert sdfg.add_state('s0').label == 's0'
+
+
 if __name__ == '__main__':
     test_read_write_set()
     test_read_write_set_y_formation()
+    test_read_write_set_constant_cover()
     test_deepcopy_state()
+    test_memlet_tree_nested_maps()
+    test_memlet_path_renamed_connectors()
+    test_block_lookup_after_moving_nodes()
+    test_unique_block_name_after_rename()